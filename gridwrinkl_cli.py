@@ -16,12 +16,917 @@ GridWrinkl CLI: GridFile과 Wrinkl 시스템을 통합한 개발 생산성 도
 import os
 import sys
 import json
-import yaml
-import shutil
+import mmap
+import stat
+import hashlib
+import string
 import datetime
-import argparse
+import functools
+import itertools
+from collections import defaultdict
+from dataclasses import dataclass
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, List, Mapping, Optional, Sequence, Union, Any, Iterator, Tuple
+
+# numpy는 가져오는 데 수십 ms가 걸리므로 그리드 배치/집계 함수 안에서 가져옵니다
+# (--version, feature, context 명령은 numpy를 쓰지 않음).
+if TYPE_CHECKING:
+    import argparse
+    import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 첫 호출 때 한꺼번에 컴파일할 커널 목록 (함수, njit 옵션)
+_JIT_KERNELS: List[Tuple[Any, Dict[str, Any]]] = []
+
+
+def _compile_kernels() -> None:
+    """
+    등록된 커널을 numba로 컴파일하여 모듈 전역 이름을 교체
+    
+    커널끼리 서로 호출하므로 전부 함께 교체합니다.
+    numba가 없으면 원래 파이썬 함수를 그대로 사용합니다.
+    """
+    # 커널 본문은 모듈 전역 np를 참조하므로 컴파일 전에 numpy를 바인딩
+    global np
+    import numpy as np
+    
+    try:
+        from numba import njit
+    except ImportError:
+        njit = None
+    
+    for func, options in _JIT_KERNELS:
+        globals()[func.__name__] = njit(**options)(func) if njit is not None else func
+    _JIT_KERNELS.clear()
+
+
+def _jit(**options: Any):
+    """
+    numba njit 지연 적용 데코레이터
+    
+    numba 가져오기는 수백 ms가 걸리므로 모듈 로드 시점이 아니라
+    커널이 처음 호출될 때 가져와 컴파일합니다 (--version, feature 등은 영향 없음).
+    
+    Args:
+        options: numba.njit 옵션
+    """
+    def decorator(func):
+        _JIT_KERNELS.append((func, options))
+        
+        @functools.wraps(func)
+        def compile_and_call(*args):
+            _compile_kernels()
+            return globals()[func.__name__](*args)
+        
+        return compile_and_call
+    
+    return decorator
+
+
+# 파일 스캔 시 건너뛸 파일·디렉토리 이름 (디렉토리는 하위로 내려가지 않음)
+IGNORE_NAMES = frozenset({
+    ".git", "__pycache__", ".venv", "node_modules",
+    ".ai", ".gridfile", ".tmp", "dist", "build"
+})
+
+# 확장자 -> 파일 타입 매핑
+_EXT_TO_TYPE = {
+    **dict.fromkeys([".py", ".js", ".ts", ".java", ".c", ".cpp", ".go", ".rs"], "code"),
+    **dict.fromkeys([".md", ".txt", ".doc", ".docx", ".pdf"], "document"),
+    **dict.fromkeys([".json", ".yaml", ".yml", ".toml", ".ini", ".config"], "config"),
+    **dict.fromkeys([".jpg", ".png", ".gif", ".svg", ".webp"], "image"),
+    **dict.fromkeys([".html", ".css", ".scss", ".sass"], "web"),
+    **dict.fromkeys([".sql", ".db"], "database"),
+    **dict.fromkeys([".zip", ".tar", ".gz", ".rar"], "archive"),
+}
+
+# 수정 경과 일수 계산용 (하루의 초 수)
+_SECONDS_PER_DAY = 86400
+
+# 파일 수가 이보다 많으면 stat 조회를 스레드 풀에서 병렬로 실행
+_PARALLEL_STAT_THRESHOLD = 200
+_STAT_BATCH_SIZE = 512
+
+# 배치 작업량(블록 수 x 빈 사각형 수)이 이보다 크고 numba가 있으면 JIT 커널로 배치
+# (그 이하는 numba 가져오기/컴파일 비용이 배치 시간보다 큼)
+_JIT_PLACEMENT_THRESHOLD = 2000
+
+# 리소스 영역으로 분류할 특수 파일 이름
+_SPECIAL_RESOURCE_NAMES = frozenset({"requirements.txt", "package.json", "setup.py"})
+
+# 통계 집계용 카테고리/파일 타입 정수 코드
+_CATEGORY_CODES = {name: code for code, name in enumerate(("active", "pending", "archive", "resources"))}
+_TYPE_CODES = {name: code for code, name in enumerate(dict.fromkeys([*_EXT_TO_TYPE.values(), "unknown"]))}
+
+
+def _count_labels(labels: List[str], codes: Dict[str, int]) -> Dict[str, int]:
+    """
+    라벨별 개수 집계
+    
+    라벨을 np.int8 코드 배열로 변환한 뒤 np.unique로 한 번에 집계합니다.
+    코드 표에 없는 라벨은 새 코드를 부여합니다.
+    
+    Args:
+        labels: 집계할 라벨 목록
+        codes: 라벨 -> 정수 코드 매핑
+        
+    Returns:
+        Dict[str, int]: 라벨별 개수
+    """
+    import numpy as np
+    
+    codes = dict(codes)
+    labels_arr = np.array([codes.setdefault(label, len(codes)) for label in labels], dtype=np.int8)
+    names = list(codes)
+    
+    unique_codes, counts = np.unique(labels_arr, return_counts=True)
+    return {names[code]: count for code, count in zip(unique_codes.tolist(), counts.tolist())}
+
+
+@functools.lru_cache(maxsize=None)
+def _numba_available() -> bool:
+    """numba 설치 여부 (가져오지 않고 확인)"""
+    import importlib.util
+    return importlib.util.find_spec("numba") is not None
+
+
+def _split_free_rect_list(free_rects: List[Tuple[int, int, int, int]], x: int, y: int, w: int, h: int) -> None:
+    """
+    배치된 사각형과 겹치는 빈 사각형을 최대 4개의 나머지 사각형으로 분할 (MaxRects)
+    
+    Args:
+        free_rects: 빈 사각형 (x, y, 너비, 높이) 목록, 제자리에서 갱신됨
+        x, y, w, h: 배치된 사각형
+    """
+    split_rects = []
+    changed = False
+    for rect in free_rects:
+        fx, fy, fw, fh = rect
+        if x >= fx + fw or x + w <= fx or y >= fy + fh or y + h <= fy:
+            split_rects.append(rect)
+            continue
+        changed = True
+        if x > fx:
+            split_rects.append((fx, fy, x - fx, fh))
+        if x + w < fx + fw:
+            split_rects.append((x + w, fy, fx + fw - x - w, fh))
+        if y > fy:
+            split_rects.append((fx, fy, fw, y - fy))
+        if y + h < fy + fh:
+            split_rects.append((fx, y + h, fw, fy + fh - y - h))
+    
+    if not changed:
+        return
+    
+    # 다른 빈 사각형에 완전히 포함되는 사각형 제거 (같은 사각형은 하나만 유지)
+    free_rects[:] = [
+        rect for i, rect in enumerate(split_rects)
+        if not any(
+            j != i and other[0] <= rect[0] and other[1] <= rect[1]
+            and other[0] + other[2] >= rect[0] + rect[2]
+            and other[1] + other[3] >= rect[1] + rect[3]
+            and (other != rect or j < i)
+            for j, other in enumerate(split_rects)
+        )
+    ]
+
+
+def _place_in_free_rect_list(free_rects: List[Tuple[int, int, int, int]], order: List[int],
+                             widths: List[int], heights: List[int], placed: List[bool],
+                             pos_x: List[int], pos_y: List[int]) -> None:
+    """
+    영역의 빈 사각형에 블록을 차례로 배치 (MaxRects, Best Short Side Fit, 파이썬 구현)
+    
+    남는 짧은 변이 가장 작은 빈 사각형을 고르고, 같으면 남는 긴 변,
+    그다음 위쪽/왼쪽 위치를 우선합니다. 빈 사각형은 줄어들기만 하므로
+    한 번 실패한 크기 이상인 블록은 다시 탐색하지 않습니다.
+    
+    Args:
+        free_rects: 영역의 빈 사각형 (x, y, 너비, 높이) 목록, 제자리에서 갱신됨
+        order: 배치 순서대로의 블록 인덱스 목록
+        widths: 블록별 너비 목록
+        heights: 블록별 높이 목록
+        placed: 블록별 배치 여부 목록, 제자리에서 갱신됨
+        pos_x: 블록별 x 좌표 목록, 제자리에서 갱신됨
+        pos_y: 블록별 y 좌표 목록, 제자리에서 갱신됨
+    """
+    fail_w = fail_h = -1
+    for i in order:
+        if not free_rects:
+            break
+        w, h = widths[i], heights[i]
+        if fail_w >= 0 and w >= fail_w and h >= fail_h:
+            continue
+        
+        best_score = None
+        for fx, fy, fw, fh in free_rects:
+            if fw < w or fh < h:
+                continue
+            leftover_w, leftover_h = fw - w, fh - h
+            score = (min(leftover_w, leftover_h), max(leftover_w, leftover_h), fy, fx)
+            if best_score is None or score < best_score:
+                best_score = score
+        
+        if best_score is None:
+            fail_w, fail_h = w, h
+            continue
+        
+        x, y = best_score[3], best_score[2]
+        placed[i] = True
+        pos_x[i] = x
+        pos_y[i] = y
+        _split_free_rect_list(free_rects, x, y, w, h)
+
+
+def _place_with_kernel(free_rects: List[Tuple[int, int, int, int]], order: List[int],
+                       widths: List[int], heights: List[int], placed: List[bool],
+                       pos_x: List[int], pos_y: List[int]) -> None:
+    """
+    _place_in_free_rect_list와 같은 배치를 numba 커널로 수행 (대규모 작업용)
+    
+    입력을 배치 순서대로의 연속 배열로 변환해 커널에 넘기고 결과를 목록에 되돌려 씁니다.
+    """
+    import numpy as np
+    
+    k = len(order)
+    rects = np.array(free_rects, dtype=np.int64).reshape(-1, 4)
+    zone_widths = np.array([widths[i] for i in order], dtype=np.int64)
+    zone_heights = np.array([heights[i] for i in order], dtype=np.int64)
+    zone_placed = np.zeros(k, dtype=np.bool_)
+    zone_x = np.full(k, -1, dtype=np.int64)
+    zone_y = np.full(k, -1, dtype=np.int64)
+    
+    rects = _place_kernel(
+        rects, np.arange(k, dtype=np.int64), zone_widths, zone_heights, zone_placed, zone_x, zone_y
+    )
+    
+    free_rects[:] = [tuple(rect) for rect in rects.tolist()]
+    for i, is_placed, x, y in zip(order, zone_placed.tolist(), zone_x.tolist(), zone_y.tolist()):
+        if is_placed:
+            placed[i] = True
+            pos_x[i] = x
+            pos_y[i] = y
+
+
+@_jit(cache=True, nogil=True)
+def _split_free_rects(free_rects: "np.ndarray", x: int, y: int, w: int, h: int) -> "np.ndarray":
+    """
+    배치된 사각형과 겹치는 빈 사각형을 최대 4개의 나머지 사각형으로 분할 (MaxRects)
+    
+    Args:
+        free_rects: 빈 사각형 (x, y, 너비, 높이) 배열
+        x, y, w, h: 배치된 사각형
+        
+    Returns:
+        np.ndarray: 분할 후 빈 사각형 배열 (겹치는 사각형이 없으면 입력 그대로)
+    """
+    n = free_rects.shape[0]
+    split_rects = np.empty((n * 4, 4), dtype=np.int64)
+    m = 0
+    changed = False
+    for i in range(n):
+        fx, fy, fw, fh = free_rects[i, 0], free_rects[i, 1], free_rects[i, 2], free_rects[i, 3]
+        if x >= fx + fw or x + w <= fx or y >= fy + fh or y + h <= fy:
+            split_rects[m] = free_rects[i]
+            m += 1
+            continue
+        changed = True
+        if x > fx:
+            split_rects[m, 0], split_rects[m, 1], split_rects[m, 2], split_rects[m, 3] = fx, fy, x - fx, fh
+            m += 1
+        if x + w < fx + fw:
+            split_rects[m, 0], split_rects[m, 1], split_rects[m, 2], split_rects[m, 3] = x + w, fy, fx + fw - x - w, fh
+            m += 1
+        if y > fy:
+            split_rects[m, 0], split_rects[m, 1], split_rects[m, 2], split_rects[m, 3] = fx, fy, fw, y - fy
+            m += 1
+        if y + h < fy + fh:
+            split_rects[m, 0], split_rects[m, 1], split_rects[m, 2], split_rects[m, 3] = fx, y + h, fw, fy + fh - y - h
+            m += 1
+    
+    if not changed:
+        return free_rects
+    
+    # 다른 빈 사각형에 완전히 포함되는 사각형 제거 (같은 사각형은 하나만 유지)
+    keep = np.ones(m, dtype=np.bool_)
+    for i in range(m):
+        for j in range(m):
+            if (j != i
+                    and split_rects[j, 0] <= split_rects[i, 0] and split_rects[j, 1] <= split_rects[i, 1]
+                    and split_rects[j, 0] + split_rects[j, 2] >= split_rects[i, 0] + split_rects[i, 2]
+                    and split_rects[j, 1] + split_rects[j, 3] >= split_rects[i, 1] + split_rects[i, 3]):
+                same = (split_rects[j, 0] == split_rects[i, 0] and split_rects[j, 1] == split_rects[i, 1]
+                        and split_rects[j, 2] == split_rects[i, 2] and split_rects[j, 3] == split_rects[i, 3])
+                if not same or j < i:
+                    keep[i] = False
+                    break
+    
+    pruned = np.empty((keep.sum(), 4), dtype=np.int64)
+    k = 0
+    for i in range(m):
+        if keep[i]:
+            pruned[k] = split_rects[i]
+            k += 1
+    return pruned
+
+
+@_jit(cache=True, nogil=True)
+def _place_kernel(free_rects: "np.ndarray", indices: "np.ndarray", widths: "np.ndarray", heights: "np.ndarray",
+                  placed: "np.ndarray", pos_x: "np.ndarray", pos_y: "np.ndarray") -> "np.ndarray":
+    """
+    영역의 빈 사각형에 블록을 차례로 배치 (MaxRects, Best Short Side Fit)
+    
+    남는 짧은 변이 가장 작은 빈 사각형을 고르고, 같으면 남는 긴 변,
+    그다음 위쪽/왼쪽 위치를 우선합니다. 빈 사각형은 줄어들기만 하므로
+    한 번 실패한 크기 이상인 블록은 다시 탐색하지 않습니다.
+    
+    Args:
+        free_rects: 영역의 빈 사각형 (x, y, 너비, 높이) 배열
+        indices: 배치할 블록 인덱스 배열
+        widths: 블록별 너비 배열
+        heights: 블록별 높이 배열
+        placed: 블록별 배치 여부 배열, 제자리에서 갱신됨
+        pos_x: 블록별 x 좌표 배열, 제자리에서 갱신됨
+        pos_y: 블록별 y 좌표 배열, 제자리에서 갱신됨
+        
+    Returns:
+        np.ndarray: 배치 후 남은 빈 사각형 배열
+    """
+    fail_w = fail_h = -1
+    for i in indices:
+        if free_rects.shape[0] == 0:
+            break
+        w, h = widths[i], heights[i]
+        if fail_w >= 0 and w >= fail_w and h >= fail_h:
+            continue
+        
+        best = -1
+        best_short = best_long = best_y = best_x = 0
+        for j in range(free_rects.shape[0]):
+            fx, fy, fw, fh = free_rects[j, 0], free_rects[j, 1], free_rects[j, 2], free_rects[j, 3]
+            if fw < w or fh < h:
+                continue
+            short = min(fw - w, fh - h)
+            long = max(fw - w, fh - h)
+            if (best < 0 or short < best_short
+                    or (short == best_short and (long < best_long
+                        or (long == best_long and (fy < best_y or (fy == best_y and fx < best_x)))))):
+                best, best_short, best_long, best_y, best_x = j, short, long, fy, fx
+        
+        if best < 0:
+            fail_w, fail_h = w, h
+            continue
+        
+        placed[i] = True
+        pos_x[i] = best_x
+        pos_y[i] = best_y
+        free_rects = _split_free_rects(free_rects, best_x, best_y, w, h)
+    
+    return free_rects
+
+
+@dataclass
+class _SkylineState:
+    """
+    영역 하나의 스카이라인 (열별로 채워진 깊이, 블록 단건 추가용)
+    
+    전체 재배치 없이 블록을 하나씩 추가할 때 사용합니다 (Skyline Bottom-Left).
+    """
+    x: int
+    y: int
+    height: int
+    skyline: "np.ndarray"
+    
+    @classmethod
+    def from_rects(cls, zone: Dict, grid_size: Dict, rects: List[Tuple[int, int, int, int]]) -> "_SkylineState":
+        """
+        이미 배치된 사각형으로 스카이라인 구성
+        
+        Args:
+            zone: 배치 영역
+            grid_size: 그리드 크기
+            rects: 배치된 (x, y, 너비, 높이) 목록
+            
+        Returns:
+            _SkylineState: 영역의 스카이라인
+        """
+        import numpy as np
+        
+        zone_x, zone_y = zone["x"], zone["y"]
+        zone_w = max(min(zone_x + zone["width"], grid_size["width"]) - zone_x, 0)
+        zone_h = max(min(zone_y + zone["height"], grid_size["height"]) - zone_y, 0)
+        
+        skyline = np.zeros(zone_w, dtype=np.int64)
+        for x, y, w, h in rects:
+            lo = max(x, zone_x) - zone_x
+            hi = min(x + w, zone_x + zone_w) - zone_x
+            if lo < hi and y < zone_y + zone_h and y + h > zone_y:
+                skyline[lo:hi] = np.maximum(skyline[lo:hi], y + h - zone_y)
+        
+        return cls(zone_x, zone_y, zone_h, skyline)
+    
+    def insert(self, w: int, h: int) -> Optional[Tuple[int, int]]:
+        """
+        스카이라인이 가장 낮은 (같으면 가장 왼쪽) 자리에 블록 배치
+        
+        Args:
+            w: 블록 너비
+            h: 블록 높이
+            
+        Returns:
+            Optional[Tuple[int, int]]: 배치된 (x, y) 좌표 (들어갈 자리가 없으면 None)
+        """
+        import numpy as np
+        
+        if w > self.skyline.shape[0] or h > self.height:
+            return None
+        
+        # 시작 열마다 블록이 덮는 구간의 최대 깊이
+        tops = np.lib.stride_tricks.sliding_window_view(self.skyline, w).max(axis=1)
+        x = int(tops.argmin())
+        top = int(tops[x])
+        if top + h > self.height:
+            return None
+        
+        self.skyline[x:x + w] = top + h
+        return self.x + x, self.y + top
+
+
+def _write_text(path: Path, content: str) -> None:
+    """UTF-8 텍스트 파일 쓰기"""
+    path.write_text(content, encoding="utf-8")
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """JSON 파일 쓰기 (orjson이 설치되어 있으면 orjson 사용)"""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        _write_text(path, json.dumps(data, indent=2, ensure_ascii=False))
+
+
+def _read_json(path: Path) -> Any:
+    """JSON 파일 읽기 (orjson이 설치되어 있으면 orjson 사용)"""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _print_json(data: Any) -> None:
+    """JSON 표준 출력 (orjson이 설치되어 있으면 직렬화한 바이트를 그대로 씀)"""
+    stdout_buffer = getattr(sys.stdout, "buffer", None)
+    if orjson is not None and stdout_buffer is not None:
+        sys.stdout.flush()
+        stdout_buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+        stdout_buffer.flush()
+    else:
+        print(json.dumps(data, indent=2))
+
+
+def _copy_file_data(src_fd: int, dst_fd: int, size: int) -> None:
+    """
+    커널 내에서 파일 데이터 복사
+    
+    os.copy_file_range를 먼저 시도하고(CoW 파일시스템에서는 reflink),
+    지원되지 않으면 os.sendfile을 사용합니다.
+    """
+    copied = 0
+    
+    if hasattr(os, "copy_file_range"):
+        try:
+            while copied < size:
+                count = os.copy_file_range(src_fd, dst_fd, size - copied)
+                if count == 0:
+                    return
+                copied += count
+            return
+        except OSError:
+            # 일부라도 복사된 뒤의 실패는 대체 경로로 복구할 수 없음
+            if copied:
+                raise
+    
+    while copied < size:
+        count = os.sendfile(dst_fd, src_fd, copied, size - copied)
+        if count == 0:
+            return
+        copied += count
+
+
+def _fast_copy(src: Union[str, Path], dst: Union[str, Path], size: Optional[int] = None) -> None:
+    """
+    파일 복사 (shutil.copy2와 같이 메타데이터 포함)
+    
+    Linux에서는 데이터가 사용자 공간을 거치지 않도록 복사하고,
+    지원되지 않는 환경이나 파일시스템에서는 shutil.copy2로 대체합니다.
+    
+    Args:
+        src: 원본 파일 경로
+        dst: 대상 파일 경로
+        size: 원본 파일 크기 (미리 알고 있는 경우)
+    """
+    import shutil
+    
+    if not hasattr(os, "sendfile"):
+        shutil.copy2(src, dst)
+        return
+    
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            if size is None:
+                size = os.fstat(fsrc.fileno()).st_size
+            _copy_file_data(fsrc.fileno(), fdst.fileno(), size)
+    except OSError:
+        shutil.copy2(src, dst)
+        return
+    
+    shutil.copystat(src, dst)
+
+
+# 동기화 파일의 자동 생성 시각 줄 (내용 비교에서 제외)
+_GENERATED_STAMP_PREFIX = "# [자동 생성됨: ".encode("utf-8")
+
+
+def _content_digest(data: Union[bytes, mmap.mmap]) -> bytes:
+    """자동 생성 시각 줄을 제외한 내용의 BLAKE2b 해시"""
+    digest = hashlib.blake2b(digest_size=16)
+    
+    with memoryview(data) as view:
+        start = data.find(_GENERATED_STAMP_PREFIX)
+        if start == -1:
+            digest.update(view)
+        else:
+            end = data.find(b"\n", start)
+            end = len(data) if end == -1 else end + 1
+            digest.update(view[:start])
+            digest.update(view[end:])
+    
+    return digest.digest()
+
+
+def _write_text_if_changed(path: Path, content: str) -> bool:
+    """
+    내용이 바뀐 경우에만 UTF-8 텍스트 파일 쓰기
+    
+    자동 생성 시각 줄만 다른 경우에는 같은 내용으로 보고 쓰지 않으므로,
+    불필요한 쓰기로 에디터/IDE의 파일 감시와 재인덱싱이 일어나지 않습니다.
+    
+    Args:
+        path: 대상 파일 경로
+        content: 새 파일 내용
+        
+    Returns:
+        bool: 실제로 파일을 썼는지 여부
+    """
+    new_digest = _content_digest(content.replace("\n", os.linesep).encode("utf-8"))
+    
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size > 0:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    if _content_digest(mapped) == new_digest:
+                        return False
+    except FileNotFoundError:
+        pass
+    
+    _write_text(path, content)
+    return True
+
+
+def _scan_ledgers(directory: Union[str, Path]) -> List[os.DirEntry]:
+    """
+    원장 디렉토리의 마크다운 파일 항목 조회
+    
+    빈 디렉토리는 git에 포함되지 않으므로 디렉토리가 없으면 빈 목록으로 취급합니다.
+    
+    Args:
+        directory: 원장 디렉토리 경로
+        
+    Returns:
+        List[os.DirEntry]: .md 파일 항목 목록
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return [entry for entry in entries if entry.name.endswith(".md")]
+    except FileNotFoundError:
+        return []
+
+
+def _stat_batch(entries: List[os.DirEntry]) -> List[Tuple[str, os.stat_result]]:
+    """DirEntry 묶음의 stat 조회 (스레드 풀 작업 단위)"""
+    return [(entry.path, entry.stat()) for entry in entries]
+
+
+def _noop(*args, **kwargs) -> None:
+    """아무것도 하지 않는 함수 (비활성화된 로그 출력용)"""
+
+
+# 마크다운 템플릿
+PROJECT_MD_TEMPLATE = string.Template("""# ${project_name}
+
+## 프로젝트 개요
+- **생성일**: ${date}
+- **GridFile-Wrinkl 버전**: 1.0.0
+
+## 설명
+이 프로젝트는 GridWrinkl 하이브리드 시스템으로 관리됩니다.
+
+## 주요 기능
+- TBD
+
+## 기술 스택
+- TBD
+
+## 개발 가이드라인
+- `.ai/patterns.md` 파일에서 코딩 패턴 확인
+- `.ai/architecture.md` 파일에서 아키텍처 가이드 확인
+- `.ai/ledgers/` 디렉토리에서 기능별 개발 원장 확인
+""")
+
+PATTERNS_MD = """# 개발 패턴 및 가이드라인
+
+## 코딩 스타일
+```python
+# 함수명: snake_case
+def process_user_data(user_input: str) -> Dict:
+    pass
+
+# 클래스명: PascalCase  
+class UserDataProcessor:
+    pass
+
+# 상수: UPPER_SNAKE_CASE
+MAX_RETRY_COUNT = 3
+```
+
+## 금기 패턴 
+❌ 전역 변수 남용
+❌ 매직 넘버 사용
+❌ 과도한 중첩 (3단계 이상)
+❌ 함수 당 50줄 이상
+
+## 테스트 전략
+- **단위 테스트**: 모든 함수 85% 이상 커버리지
+- **통합 테스트**: 주요 워크플로우 커버
+- **E2E 테스트**: 핵심 사용자 시나리오
+
+## GridFile 연동 패턴
+- **활성 개발 파일**: 빨간색 블록 (active 존)
+- **참조 자료**: 파란색 블록 (resources 존)
+- **완료 파일**: 초록색 블록 (archive 존)
+
+## 파일 명명 규칙
+- **기능별**: `feature_name_component.ext`
+- **유틸리티**: `utils_specific_purpose.ext`
+- **테스트**: `test_feature_name.ext`
+- **문서**: `docs_topic_name.md`
+"""
+
+ARCHITECTURE_MD = """# 시스템 아키텍처
+
+## 전체 구조
+```
+프로젝트
+├── 프레젠테이션 레이어
+├── 비즈니스 로직 레이어  
+├── 데이터 접근 레이어
+└── 인프라 레이어
+```
+
+## 주요 기술 결정
+- TBD
+
+## 보안 고려사항
+- 입력 검증 필수
+- 인증/인가 체계 구현
+- 민감 정보 관리 방안
+
+## 확장성 전략
+- 모듈화된 설계
+- 명확한 인터페이스 정의
+- 의존성 주입 패턴 활용
+
+## GridFile 통합 아키텍처
+- **개발 파일**: 활성 존에 배치
+- **설정 파일**: 리소스 존에 배치
+- **빌드 결과물**: 아카이브 존에 배치
+"""
+
+CONTEXT_RULES_MD = """# AI 어시스턴트 가이드라인
+
+## 기본 원칙
+1. **맥락 우선**: 항상 .ai/ 디렉토리의 정보를 먼저 확인
+2. **일관성**: patterns.md의 가이드라인 준수
+3. **점진적 개선**: 기존 코드 스타일과 조화
+4. **문서화**: 코드 변경 시 관련 문서 업데이트
+
+## 코드 생성 규칙
+- 주석은 한국어로 작성
+- 함수 docstring은 필수
+- 타입 힌트 사용
+- 에러 처리 포함
+
+## 파일 구조 규칙
+- 새 파일 생성 시 GridFile 블록 생성
+- 기능별 디렉토리 구조 유지
+- 임시 파일은 .tmp/ 디렉토리에 생성
+
+## 품질 체크리스트
+- [ ] 코드 스타일 준수
+- [ ] 테스트 코드 포함
+- [ ] 문서 업데이트
+- [ ] GridFile 블록 할당
+- [ ] 보안 검토 완료
+"""
+
+ACTIVE_MD_TEMPLATE = string.Template("""# 활성 기능 대시보드
+
+## 현재 개발 중인 기능
+*이 파일은 자동 업데이트됩니다*
+
+생성일: ${created_at}
+
+## 활성 기능 목록
+- 아직 등록된 기능이 없습니다
+- `gridwrinkl feature <feature-name>` 명령어로 새 기능을 시작하세요
+
+## GridFile 상태
+- **활성 블록**: 0개
+- **대기 블록**: 0개  
+- **완료 블록**: 0개
+- **그리드 효율성**: 0%
+
+## 최근 활동
+- ${date}: 시스템 초기화 완료
+""")
+
+CURSOR_RULES_TEMPLATE = string.Template("""# ${project_name} - Cursor AI 규칙
+
+## 프로젝트 맥락
+이 프로젝트는 GridFile-Wrinkl 하이브리드 시스템을 사용합니다.
+
+## 필수 확인사항
+1. .ai/ledgers/에서 현재 작업 중인 기능 확인
+2. .ai/patterns.md의 코딩 패턴 준수
+3. .ai/context-rules.md의 가이드라인 준수
+
+## 파일 작업 시
+- 새 파일 생성 시 GridFile 블록 할당 고려
+- 기능별로 일관된 디렉토리 구조 유지
+- 변경사항을 해당 기능의 ledger에 기록
+
+## 코드 스타일
+- 주석: 한국어
+- 함수명: snake_case
+- 클래스명: PascalCase
+- 타입 힌트 필수
+
+## 금지사항
+- 전역 변수 남용
+- 매직 넘버 사용
+- 과도한 중첩 (3단계 이상)
+- 테스트 없는 코드 작성
+""")
+
+COPILOT_INSTRUCTIONS_TEMPLATE = string.Template("""# ${project_name} - GitHub Copilot 지침
+
+이 프로젝트는 GridFile-Wrinkl 통합 시스템을 사용합니다.
+
+## 작업 전 체크리스트
+- [ ] .ai/ledgers/에서 현재 기능 컨텍스트 확인
+- [ ] .ai/patterns.md의 코딩 패턴 검토
+- [ ] .ai/architecture.md의 설계 원칙 확인
+
+## 코드 생성 가이드라인
+- 한국어 주석 사용
+- 타입 힌트 포함
+- 에러 처리 구현
+- 테스트 코드 생성
+
+## 파일 관리
+- 새 파일은 적절한 GridFile 존에 배치
+- 기능별 디렉토리 구조 유지
+- 임시 파일은 .tmp/ 사용
+
+## 문서화
+- 함수 docstring 필수
+- 복잡한 로직은 인라인 주석
+- 변경사항을 ledger에 기록
+""")
+
+LEDGER_TEMPLATE = string.Template("""# ${feature_name} - 기능 개발 원장
+
+## 기본 정보
+- **기능명**: ${feature_name}
+- **생성일**: ${created_at}
+- **상태**: 개발 중
+- **담당자**: TBD
+
+## 요구사항
+${description}
+
+## 기술적 접근
+- **사용 기술**: TBD
+- **아키텍처**: TBD
+- **의존성**: TBD
+
+## 개발 진행사항
+### ${date}
+- 기능 원장 생성
+- 초기 기획 시작
+
+## 파일 구조
+```
+관련 파일들이 여기에 표시됩니다
+```
+
+## GridFile 블록 정보
+- **배치 존**: active (활성 개발)
+- **블록 크기**: 표준 (2x2)
+- **색상**: 빨간색 (활성 프로젝트)
+
+## 테스트 계획
+- [ ] 단위 테스트 작성
+- [ ] 통합 테스트 작성
+- [ ] 사용자 테스트 계획
+
+## 완료 체크리스트
+- [ ] 코드 구현 완료
+- [ ] 테스트 통과
+- [ ] 문서 업데이트
+- [ ] 코드 리뷰 완료
+- [ ] 배포 완료
+
+## 회고
+*완료 후 작성*
+""")
+
+CURSOR_RULES_SYNC_TEMPLATE = string.Template("""# ${project_name} - Cursor AI 규칙
+# [자동 생성됨: ${generated_at}]
+
+## 프로젝트 맥락
+이 프로젝트는 GridFile-Wrinkl 하이브리드 시스템을 사용합니다.
+
+## 현재 작업 중인 기능
+${features}
+
+## 필수 확인사항
+1. .ai/ledgers/에서 현재 작업 중인 기능 확인
+2. .ai/patterns.md의 코딩 패턴 준수
+3. .ai/context-rules.md의 가이드라인 준수
+
+## 파일 작업 시
+- 새 파일 생성 시 GridFile 블록 할당 고려
+- 기능별로 일관된 디렉토리 구조 유지
+- 변경사항을 해당 기능의 ledger에 기록
+
+## 코드 스타일
+- 주석: 한국어
+- 함수명: snake_case
+- 클래스명: PascalCase
+- 타입 힌트 필수
+
+## 금지사항
+- 전역 변수 남용
+- 매직 넘버 사용
+- 과도한 중첩 (3단계 이상)
+- 테스트 없는 코드 작성
+""")
+
+COPILOT_INSTRUCTIONS_SYNC_TEMPLATE = string.Template("""# ${project_name} - GitHub Copilot 지침
+# [자동 생성됨: ${generated_at}]
+
+이 프로젝트는 GridFile-Wrinkl 통합 시스템을 사용합니다.
+
+## 현재 작업 중인 기능
+${features}
+
+## 작업 전 체크리스트
+- [ ] .ai/ledgers/에서 현재 기능 컨텍스트 확인
+- [ ] .ai/patterns.md의 코딩 패턴 검토
+- [ ] .ai/architecture.md의 설계 원칙 확인
+
+## 코드 생성 가이드라인
+- 한국어 주석 사용
+- 타입 힌트 포함
+- 에러 처리 구현
+- 테스트 코드 생성
+
+## 파일 관리
+- 새 파일은 적절한 GridFile 존에 배치
+- 기능별 디렉토리 구조 유지
+- 임시 파일은 .tmp/ 사용
+
+## 문서화
+- 함수 docstring 필수
+- 복잡한 로직은 인라인 주석
+- 변경사항을 ledger에 기록
+""")
 
 
 class ConsoleColors:
@@ -35,6 +940,10 @@ class ConsoleColors:
     ENDC = '\033[0m'
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
+    
+    # 기능 상태 표시 (색상 적용 완료된 문자열)
+    GREEN_ACTIVE = f"{GREEN}활성{ENDC}"
+    YELLOW_ARCHIVED = f"{YELLOW}아카이브됨{ENDC}"
 
 
 class GridWrinkl:
@@ -53,24 +962,36 @@ class GridWrinkl:
             project_path: 프로젝트 경로 (기본값: 현재 디렉토리)
             debug: 디버그 모드 활성화 여부
         """
-        self.project_path = Path(project_path).resolve()
+        self.project_path = Path(project_path)
         self.debug_mode = debug
         self.gridfile_dir = self.project_path / ".gridfile"
         self.ai_dir = self.project_path / ".ai"
         self.config = None
+        self._config_mtime = 0
+        
+        # 명령 실행 시각 (init()에서 한 번만 기록하여 재사용)
+        self._now: Optional[datetime.datetime] = None
+        self._now_iso = ""
+        self._now_date = ""
         
-        # 색상 관련 선호도
-        self.color_enabled = True
+        # 기능 목록 캐시 (include_archived 값별, 원장 변경 시 무효화)
+        self._features_cache: Dict[bool, List[Dict]] = {}
         
-        # 영역 매핑 (카테고리 -> 그리드 영역)
-        self.category_to_zone = {
+        # 로그 출력 설정 (디버그 비활성화 시 _log_debug는 no-op)
+        self._log_debug = self._log_debug_enabled if debug else _noop
+        
+        # 색상 관련 선호도 (터미널 출력일 때만 기본 활성화)
+        self.color_enabled = sys.stdout is not None and sys.stdout.isatty()
+        
+        # 영역 매핑 (카테고리 -> 그리드 영역, 읽기 전용)
+        self.category_to_zone = MappingProxyType({
             "active": "active",
             "pending": "active",
             "archive": "archive",
             "completed": "archive",
             "resources": "resources",
             "reference": "resources"
-        }
+        })
         
         # AI 도구 설정 파일 매핑
         self.ai_tools = {
@@ -80,38 +1001,55 @@ class GridWrinkl:
             "augment": "augment.md"
         }
         
-    def _log_debug(self, message: str) -> None:
+    @functools.cached_property
+    def project_path_resolved(self) -> Path:
+        """절대 경로로 변환한 프로젝트 경로 (필요한 명령에서만 계산)"""
+        return self.project_path.resolve()
+    
+    @property
+    def color_enabled(self) -> bool:
+        """색상 출력 여부"""
+        return self._color_enabled
+    
+    @color_enabled.setter
+    def color_enabled(self, enabled: bool) -> None:
+        """색상 출력 여부 설정 (로그 접두사/접미사를 미리 계산)"""
+        self._color_enabled = enabled
+        
+        if enabled:
+            self._debug_prefix = f"{ConsoleColors.CYAN}[DEBUG] "
+            self._info_prefix = f"{ConsoleColors.BLUE}[INFO] "
+            self._success_prefix = f"{ConsoleColors.GREEN}[SUCCESS] "
+            self._warning_prefix = f"{ConsoleColors.YELLOW}[WARNING] "
+            self._error_prefix = f"{ConsoleColors.RED}[ERROR] "
+            self._reset = ConsoleColors.ENDC
+        else:
+            self._debug_prefix = "[DEBUG] "
+            self._info_prefix = "[INFO] "
+            self._success_prefix = "[SUCCESS] "
+            self._warning_prefix = "[WARNING] "
+            self._error_prefix = "[ERROR] "
+            self._reset = ""
+    
+    def _log_debug_enabled(self, message: str) -> None:
         """디버그 메시지 출력"""
-        if self.debug_mode:
-            print(f"{ConsoleColors.CYAN}[DEBUG] {message}{ConsoleColors.ENDC}")
+        print(self._debug_prefix, message, self._reset, sep="")
     
     def _log_info(self, message: str) -> None:
         """정보 메시지 출력"""
-        if self.color_enabled:
-            print(f"{ConsoleColors.BLUE}[INFO] {message}{ConsoleColors.ENDC}")
-        else:
-            print(f"[INFO] {message}")
+        print(self._info_prefix, message, self._reset, sep="")
     
     def _log_success(self, message: str) -> None:
         """성공 메시지 출력"""
-        if self.color_enabled:
-            print(f"{ConsoleColors.GREEN}[SUCCESS] {message}{ConsoleColors.ENDC}")
-        else:
-            print(f"[SUCCESS] {message}")
+        print(self._success_prefix, message, self._reset, sep="")
     
     def _log_warning(self, message: str) -> None:
         """경고 메시지 출력"""
-        if self.color_enabled:
-            print(f"{ConsoleColors.YELLOW}[WARNING] {message}{ConsoleColors.ENDC}")
-        else:
-            print(f"[WARNING] {message}")
+        print(self._warning_prefix, message, self._reset, sep="")
     
     def _log_error(self, message: str) -> None:
         """에러 메시지 출력"""
-        if self.color_enabled:
-            print(f"{ConsoleColors.RED}[ERROR] {message}{ConsoleColors.ENDC}")
-        else:
-            print(f"[ERROR] {message}")
+        print(self._error_prefix, message, self._reset, sep="")
     
     def is_initialized(self) -> bool:
         """
@@ -142,6 +1080,10 @@ class GridWrinkl:
         
         self._log_info(f"프로젝트 '{project_name}'을(를) 초기화합니다...")
         
+        self._now = datetime.datetime.now()
+        self._now_iso = self._now.isoformat()
+        self._now_date = self._now.strftime('%Y-%m-%d')
+        
         # 1. 기본 디렉토리 구조 생성
         self._create_directory_structure()
         
@@ -166,24 +1108,23 @@ class GridWrinkl:
         """기본 디렉토리 구조 생성"""
         self._log_info("기본 디렉토리 구조를 생성합니다...")
         
-        directories = [
-            ".gridfile",
+        # 상위 디렉토리(.gridfile, .ai, .ai/ledgers)는 os.makedirs가 함께 생성
+        directories = (
             ".gridfile/layouts",
             ".gridfile/templates",
             ".gridfile/backups",
-            ".ai",
-            ".ai/ledgers",
             ".ai/ledgers/active",
             ".ai/ledgers/archived",
             ".ai/templates",
             ".ai/resources",
             ".ai/patterns",
             ".ai/context-snapshots"
-        ]
+        )
         
+        root = str(self.project_path)
         for directory in directories:
-            dir_path = self.project_path / directory
-            dir_path.mkdir(parents=True, exist_ok=True)
+            dir_path = os.path.join(root, directory)
+            os.makedirs(dir_path, exist_ok=True)
             self._log_debug(f"디렉토리 생성: {dir_path}")
     
     def _create_config(self, project_name: str) -> None:
@@ -191,7 +1132,7 @@ class GridWrinkl:
         config = {
             "project_name": project_name,
             "version": "1.0.0",
-            "created_at": datetime.datetime.now().isoformat(),
+            "created_at": self._now_iso,
             "grid_size": {"width": 12, "height": 8},
             "zones": {
                 "active": {"x": 0, "y": 0, "width": 6, "height": 4},
@@ -203,295 +1144,164 @@ class GridWrinkl:
         }
         
         config_path = self.gridfile_dir / "config.json"
-        with open(config_path, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+        _write_json(config_path, config)
         
         self._log_debug(f"설정 파일 생성: {config_path}")
         self.config = config
+        self._config_mtime = config_path.stat().st_mtime_ns
+    
+    def _load_config(self) -> Optional[Dict]:
+        """
+        설정 파일 로드 (파일 수정 시각이 바뀐 경우에만 다시 파싱)
+        
+        Returns:
+            Optional[Dict]: 프로젝트 설정 (설정 파일이 없으면 None)
+        """
+        config_path = self.gridfile_dir / "config.json"
+        try:
+            mtime = config_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+        
+        if self.config is None or mtime != self._config_mtime:
+            self.config = _read_json(config_path)
+            self._config_mtime = mtime
+        
+        return self.config
     
     def _create_context_files(self, project_name: str) -> None:
         """기본 맥락 파일 생성"""
         self._log_info("맥락 파일을 생성합니다...")
         
         # 1. 프로젝트 개요
-        project_md = f"""# {project_name}
-
-## 프로젝트 개요
-- **생성일**: {datetime.datetime.now().strftime('%Y-%m-%d')}
-- **GridFile-Wrinkl 버전**: 1.0.0
-
-## 설명
-이 프로젝트는 GridWrinkl 하이브리드 시스템으로 관리됩니다.
-
-## 주요 기능
-- TBD
-
-## 기술 스택
-- TBD
-
-## 개발 가이드라인
-- `.ai/patterns.md` 파일에서 코딩 패턴 확인
-- `.ai/architecture.md` 파일에서 아키텍처 가이드 확인
-- `.ai/ledgers/` 디렉토리에서 기능별 개발 원장 확인
-"""
+        project_md = PROJECT_MD_TEMPLATE.substitute(
+            project_name=project_name,
+            date=self._now_date
+        )
         
-        with open(self.ai_dir / "project.md", "w", encoding="utf-8") as f:
-            f.write(project_md)
+        _write_text(self.ai_dir / "project.md", project_md)
         
         # 2. 패턴 가이드
-        patterns_md = """# 개발 패턴 및 가이드라인
-
-## 코딩 스타일
-```python
-# 함수명: snake_case
-def process_user_data(user_input: str) -> Dict:
-    pass
-
-# 클래스명: PascalCase  
-class UserDataProcessor:
-    pass
-
-# 상수: UPPER_SNAKE_CASE
-MAX_RETRY_COUNT = 3
-```
-
-## 금기 패턴 
-❌ 전역 변수 남용
-❌ 매직 넘버 사용
-❌ 과도한 중첩 (3단계 이상)
-❌ 함수 당 50줄 이상
-
-## 테스트 전략
-- **단위 테스트**: 모든 함수 85% 이상 커버리지
-- **통합 테스트**: 주요 워크플로우 커버
-- **E2E 테스트**: 핵심 사용자 시나리오
-
-## GridFile 연동 패턴
-- **활성 개발 파일**: 빨간색 블록 (active 존)
-- **참조 자료**: 파란색 블록 (resources 존)
-- **완료 파일**: 초록색 블록 (archive 존)
-
-## 파일 명명 규칙
-- **기능별**: `feature_name_component.ext`
-- **유틸리티**: `utils_specific_purpose.ext`
-- **테스트**: `test_feature_name.ext`
-- **문서**: `docs_topic_name.md`
-"""
-        
-        with open(self.ai_dir / "patterns.md", "w", encoding="utf-8") as f:
-            f.write(patterns_md)
+        _write_text(self.ai_dir / "patterns.md", PATTERNS_MD)
         
         # 3. 아키텍처 가이드
-        architecture_md = """# 시스템 아키텍처
-
-## 전체 구조
-```
-프로젝트
-├── 프레젠테이션 레이어
-├── 비즈니스 로직 레이어  
-├── 데이터 접근 레이어
-└── 인프라 레이어
-```
-
-## 주요 기술 결정
-- TBD
-
-## 보안 고려사항
-- 입력 검증 필수
-- 인증/인가 체계 구현
-- 민감 정보 관리 방안
-
-## 확장성 전략
-- 모듈화된 설계
-- 명확한 인터페이스 정의
-- 의존성 주입 패턴 활용
-
-## GridFile 통합 아키텍처
-- **개발 파일**: 활성 존에 배치
-- **설정 파일**: 리소스 존에 배치
-- **빌드 결과물**: 아카이브 존에 배치
-"""
-        
-        with open(self.ai_dir / "architecture.md", "w", encoding="utf-8") as f:
-            f.write(architecture_md)
+        _write_text(self.ai_dir / "architecture.md", ARCHITECTURE_MD)
         
         # 4. AI 컨텍스트 규칙
-        context_rules_md = """# AI 어시스턴트 가이드라인
-
-## 기본 원칙
-1. **맥락 우선**: 항상 .ai/ 디렉토리의 정보를 먼저 확인
-2. **일관성**: patterns.md의 가이드라인 준수
-3. **점진적 개선**: 기존 코드 스타일과 조화
-4. **문서화**: 코드 변경 시 관련 문서 업데이트
-
-## 코드 생성 규칙
-- 주석은 한국어로 작성
-- 함수 docstring은 필수
-- 타입 힌트 사용
-- 에러 처리 포함
-
-## 파일 구조 규칙
-- 새 파일 생성 시 GridFile 블록 생성
-- 기능별 디렉토리 구조 유지
-- 임시 파일은 .tmp/ 디렉토리에 생성
-
-## 품질 체크리스트
-- [ ] 코드 스타일 준수
-- [ ] 테스트 코드 포함
-- [ ] 문서 업데이트
-- [ ] GridFile 블록 할당
-- [ ] 보안 검토 완료
-"""
-        
-        with open(self.ai_dir / "context-rules.md", "w", encoding="utf-8") as f:
-            f.write(context_rules_md)
+        _write_text(self.ai_dir / "context-rules.md", CONTEXT_RULES_MD)
         
         # 5. 활성 기능 대시보드
-        active_md = f"""# 활성 기능 대시보드
-
-## 현재 개발 중인 기능
-*이 파일은 자동 업데이트됩니다*
-
-생성일: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-## 활성 기능 목록
-- 아직 등록된 기능이 없습니다
-- `gridwrinkl feature <feature-name>` 명령어로 새 기능을 시작하세요
-
-## GridFile 상태
-- **활성 블록**: 0개
-- **대기 블록**: 0개  
-- **완료 블록**: 0개
-- **그리드 효율성**: 0%
-
-## 최근 활동
-- {datetime.datetime.now().strftime('%Y-%m-%d')}: 시스템 초기화 완료
-"""
+        active_md = ACTIVE_MD_TEMPLATE.substitute(
+            created_at=self._now.strftime('%Y-%m-%d %H:%M:%S'),
+            date=self._now_date
+        )
         
-        with open(self.ai_dir / "ledgers" / "_active.md", "w", encoding="utf-8") as f:
-            f.write(active_md)
+        _write_text(self.ai_dir / "ledgers" / "_active.md", active_md)
     
     def _create_ai_tool_configs(self, project_name: str) -> None:
         """AI 도구 설정 파일 생성"""
         self._log_info("AI 도구 설정 파일을 생성합니다...")
         
         # Cursor 설정
-        cursor_rules = f"""# {project_name} - Cursor AI 규칙
-
-## 프로젝트 맥락
-이 프로젝트는 GridFile-Wrinkl 하이브리드 시스템을 사용합니다.
-
-## 필수 확인사항
-1. .ai/ledgers/에서 현재 작업 중인 기능 확인
-2. .ai/patterns.md의 코딩 패턴 준수
-3. .ai/context-rules.md의 가이드라인 준수
-
-## 파일 작업 시
-- 새 파일 생성 시 GridFile 블록 할당 고려
-- 기능별로 일관된 디렉토리 구조 유지
-- 변경사항을 해당 기능의 ledger에 기록
-
-## 코드 스타일
-- 주석: 한국어
-- 함수명: snake_case
-- 클래스명: PascalCase
-- 타입 힌트 필수
-
-## 금지사항
-- 전역 변수 남용
-- 매직 넘버 사용
-- 과도한 중첩 (3단계 이상)
-- 테스트 없는 코드 작성
-"""
-        
-        with open(self.project_path / ".cursorrules", "w", encoding="utf-8") as f:
-            f.write(cursor_rules)
-        
-        # GitHub Copilot 설정
-        github_dir = self.project_path / ".github"
-        github_dir.mkdir(exist_ok=True)
+        cursor_rules = CURSOR_RULES_TEMPLATE.substitute(project_name=project_name)
         
-        copilot_instructions = f"""# {project_name} - GitHub Copilot 지침
-
-이 프로젝트는 GridFile-Wrinkl 통합 시스템을 사용합니다.
-
-## 작업 전 체크리스트
-- [ ] .ai/ledgers/에서 현재 기능 컨텍스트 확인
-- [ ] .ai/patterns.md의 코딩 패턴 검토
-- [ ] .ai/architecture.md의 설계 원칙 확인
-
-## 코드 생성 가이드라인
-- 한국어 주석 사용
-- 타입 힌트 포함
-- 에러 처리 구현
-- 테스트 코드 생성
-
-## 파일 관리
-- 새 파일은 적절한 GridFile 존에 배치
-- 기능별 디렉토리 구조 유지
-- 임시 파일은 .tmp/ 사용
-
-## 문서화
-- 함수 docstring 필수
-- 복잡한 로직은 인라인 주석
-- 변경사항을 ledger에 기록
-"""
+        _write_text(self.project_path / ".cursorrules", cursor_rules)
         
-        with open(github_dir / "copilot-instructions.md", "w", encoding="utf-8") as f:
-            f.write(copilot_instructions)
+        # GitHub Copilot 설정
+        github_dir = self.project_path / ".github"
+        github_dir.mkdir(exist_ok=True)
+        
+        copilot_instructions = COPILOT_INSTRUCTIONS_TEMPLATE.substitute(project_name=project_name)
+        
+        _write_text(github_dir / "copilot-instructions.md", copilot_instructions)
     
     def _scan_and_organize_files(self) -> None:
         """기존 프로젝트 파일 스캔 및 분석"""
         self._log_info("프로젝트 파일을 스캔하고 분석합니다...")
         
-        # 파일 수집
-        files = []
-        for file_path in self.project_path.glob("**/*"):
-            if file_path.is_file() and not self._should_ignore_file(file_path):
-                files.append(file_path)
+        # 파일 수집 (무시 디렉토리는 하위로 내려가지 않음)
+        entries = list(self._walk(str(self.project_path_resolved)))
+        
+        self._log_info(f"{len(entries)}개의 파일을 발견했습니다.")
         
-        self._log_info(f"{len(files)}개의 파일을 발견했습니다.")
+        files = self._stat_entries(entries)
         
         # 파일 분류 및 초기 그리드 레이아웃 생성
         grid_layout = self._create_initial_grid_layout(files)
         
         # 레이아웃 저장
         layout_path = self.gridfile_dir / "layouts" / "initial.json"
-        with open(layout_path, "w", encoding="utf-8") as f:
-            json.dump(grid_layout, f, indent=2, ensure_ascii=False)
+        _write_json(layout_path, grid_layout)
             
         self._log_debug(f"초기 그리드 레이아웃 저장: {layout_path}")
     
-    def _should_ignore_file(self, file_path: Path) -> bool:
-        """무시해야 할 파일인지 확인"""
-        ignore_patterns = [
-            ".git", "__pycache__", ".venv", "node_modules",
-            ".ai", ".gridfile", ".tmp", "dist", "build"
-        ]
+    def _walk(self, root: str) -> Iterator[os.DirEntry]:
+        """
+        프로젝트 파일 순회
+        
+        무시 대상 이름의 항목은 디렉토리 단위로 건너뜁니다.
+        파일을 가리키는 심볼릭 링크는 포함하지만, 디렉토리 링크는 순환을 막기 위해
+        따라가지 않습니다. 읽을 수 없는 디렉토리는 하위 트리째 건너뜁니다.
+        
+        Args:
+            root: 순회를 시작할 디렉토리 경로
+            
+        Yields:
+            os.DirEntry: 파일 항목
+        """
+        try:
+            scanner = os.scandir(root)
+        except OSError as e:
+            self._log_debug(f"디렉토리를 읽을 수 없어 건너뜁니다: {root} ({e})")
+            return
+        
+        with scanner as entries:
+            for entry in entries:
+                if entry.name in IGNORE_NAMES:
+                    continue
+                
+                if entry.is_dir(follow_symlinks=False):
+                    yield from self._walk(entry.path)
+                elif entry.is_file():
+                    yield entry
+    
+    def _stat_entries(self, entries: List[os.DirEntry]) -> List[Tuple[str, os.stat_result]]:
+        """
+        파일 stat 조회
+        
+        파일이 많으면 묶음 단위로 스레드 풀에 나누어 stat 시스템 호출을
+        겹쳐 실행하므로, 네트워크 파일시스템 등에서 I/O 지연이 숨겨집니다.
+        
+        Args:
+            entries: 순회로 수집한 파일 항목 목록
+            
+        Returns:
+            List[Tuple[str, os.stat_result]]: 입력 순서대로의 (파일 경로, stat 결과)
+        """
+        if len(entries) <= _PARALLEL_STAT_THRESHOLD:
+            return _stat_batch(entries)
+        
+        from concurrent.futures import ThreadPoolExecutor
         
-        str_path = str(file_path)
-        return any(pattern in str_path for pattern in ignore_patterns)
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        batch_size = min(_STAT_BATCH_SIZE, -(-len(entries) // max_workers))
+        batches = [entries[i:i + batch_size] for i in range(0, len(entries), batch_size)]
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+            return [item for batch in executor.map(_stat_batch, batches) for item in batch]
     
-    def _create_initial_grid_layout(self, files: List[Path]) -> Dict:
+    def _create_initial_grid_layout(self, files: List[Tuple[str, os.stat_result]]) -> Dict:
         """초기 그리드 레이아웃 생성"""
+        root = str(self.project_path_resolved)
+        now_ts = self._now.timestamp()
+        
         # 파일 분석
-        file_blocks = []
-        for file_path in files:
-            file_info = self._analyze_file(file_path)
-            file_blocks.append({
-                "path": str(file_path.relative_to(self.project_path)),
-                "name": file_path.name,
-                "type": file_info["type"],
-                "category": file_info["category"],
-                "size": file_info["size"],
-                "modified": file_info["modified"],
-                "placed": False
-            })
+        file_blocks = [self._file_block(file_path, stats, root, now_ts) for file_path, stats in files]
         
         # 레이아웃 생성
         layout = {
             "version": "1.0.0",
-            "timestamp": datetime.datetime.now().isoformat(),
+            "timestamp": self._now_iso,
             "grid_size": self.config["grid_size"],
             "zones": self.config["zones"],
             "blocks": file_blocks,
@@ -504,54 +1314,59 @@ MAX_RETRY_COUNT = 3
         }
         
         # 통계 집계
-        category_counts = {}
-        type_counts = {}
-        
-        for block in file_blocks:
-            category = block["category"]
-            file_type = block["type"]
-            
-            if category in category_counts:
-                category_counts[category] += 1
-            else:
-                category_counts[category] = 1
-                
-            if file_type in type_counts:
-                type_counts[file_type] += 1
-            else:
-                type_counts[file_type] = 1
-        
-        layout["stats"]["by_category"] = category_counts
-        layout["stats"]["by_type"] = type_counts
+        layout["stats"]["by_category"] = _count_labels(
+            [block["category"] for block in file_blocks], _CATEGORY_CODES
+        )
+        layout["stats"]["by_type"] = _count_labels(
+            [block["type"] for block in file_blocks], _TYPE_CODES
+        )
         
         return layout
     
-    def _analyze_file(self, file_path: Path) -> Dict:
-        """파일 분석"""
-        stats = file_path.stat()
+    def _file_block(self, file_path: str, stats: os.stat_result, root: str, now_ts: float) -> Dict:
+        """
+        파일을 분석해 미배치 상태의 그리드 블록 생성
+        
+        Args:
+            file_path: 파일 경로
+            stats: 파일의 stat 결과
+            root: 상대 경로 기준 디렉토리
+            now_ts: 기준 시각 (POSIX 타임스탬프)
+            
+        Returns:
+            Dict: 그리드 블록
+        """
+        file_info = self._analyze_file(file_path, stats, now_ts)
+        return {
+            "path": os.path.relpath(file_path, root),
+            "name": os.path.basename(file_path),
+            "type": file_info["type"],
+            "category": file_info["category"],
+            "size": file_info["size"],
+            "modified": file_info["modified"],
+            "placed": False
+        }
+    
+    def _analyze_file(self, file_path: str, stats: os.stat_result, now_ts: float) -> Dict:
+        """
+        파일 분석
+        
+        Args:
+            file_path: 분석할 파일 경로
+            stats: 순회 중 미리 조회한 파일의 stat 결과
+            now_ts: 스캔 시작 시각 (POSIX 타임스탬프)
+            
+        Returns:
+            Dict: 파일 타입, 카테고리, 크기, 수정 시각
+        """
+        name = os.path.basename(file_path)
         
         # 파일 타입 추론
-        ext = file_path.suffix.lower()
-        file_type = "unknown"
-        
-        if ext in [".py", ".js", ".ts", ".java", ".c", ".cpp", ".go", ".rs"]:
-            file_type = "code"
-        elif ext in [".md", ".txt", ".doc", ".docx", ".pdf"]:
-            file_type = "document"
-        elif ext in [".json", ".yaml", ".yml", ".toml", ".ini", ".config"]:
-            file_type = "config"
-        elif ext in [".jpg", ".png", ".gif", ".svg", ".webp"]:
-            file_type = "image"
-        elif ext in [".html", ".css", ".scss", ".sass"]:
-            file_type = "web"
-        elif ext in [".sql", ".db"]:
-            file_type = "database"
-        elif ext in [".zip", ".tar", ".gz", ".rar"]:
-            file_type = "archive"
-        
-        # 카테고리 추론 (수정 시간 기준)
-        days_since_modified = (datetime.datetime.now() - 
-                              datetime.datetime.fromtimestamp(stats.st_mtime)).days
+        ext = os.path.splitext(name)[1].lower()
+        file_type = _EXT_TO_TYPE.get(ext, "unknown")
+        
+        # 카테고리 추론 (수정 시간 기준, timedelta.days와 같은 내림 일수)
+        days_since_modified = int((now_ts - stats.st_mtime) // _SECONDS_PER_DAY)
         
         if days_since_modified < 7:
             category = "active"
@@ -561,11 +1376,11 @@ MAX_RETRY_COUNT = 3
             category = "archive"
             
         # 특수 파일 처리
-        if file_path.name.startswith("README"):
+        if name.startswith("README"):
             category = "resources"
-        elif file_path.name in ["requirements.txt", "package.json", "setup.py"]:
+        elif name in _SPECIAL_RESOURCE_NAMES:
             category = "resources"
-        elif file_path.name.startswith("test_") or file_path.name.endswith("_test.py"):
+        elif name.startswith("test_") or name.endswith("_test.py"):
             category = "resources"
         
         return {
@@ -575,6 +1390,11 @@ MAX_RETRY_COUNT = 3
             "modified": datetime.datetime.fromtimestamp(stats.st_mtime).isoformat()
         }
 
+    @staticmethod
+    def _normalize(name: str) -> str:
+        """기능명 정규화 (대시를 밑줄로 변환, 대시가 없으면 그대로 반환)"""
+        return name.replace("-", "_") if "-" in name else name
+    
     def create_feature(self, feature_name: str, description: str = "", skip_dash_conversion: bool = False) -> str:
         """
         새로운 기능 개발을 시작하기 위한 원장(ledger) 파일 생성
@@ -593,7 +1413,7 @@ MAX_RETRY_COUNT = 3
         
         # 기능명 정규화
         if not skip_dash_conversion:
-            feature_name = feature_name.replace("-", "_")
+            feature_name = self._normalize(feature_name)
         
         ledger_path = self.ai_dir / "ledgers" / "active" / f"{feature_name}.md"
         if ledger_path.exists():
@@ -602,56 +1422,17 @@ MAX_RETRY_COUNT = 3
         
         self._log_info(f"'{feature_name}' 기능의 개발을 시작합니다...")
         
-        ledger_content = f"""# {feature_name} - 기능 개발 원장
-
-## 기본 정보
-- **기능명**: {feature_name}
-- **생성일**: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-- **상태**: 개발 중
-- **담당자**: TBD
-
-## 요구사항
-{description or '- TBD'}
-
-## 기술적 접근
-- **사용 기술**: TBD
-- **아키텍처**: TBD
-- **의존성**: TBD
-
-## 개발 진행사항
-### {datetime.datetime.now().strftime('%Y-%m-%d')}
-- 기능 원장 생성
-- 초기 기획 시작
-
-## 파일 구조
-```
-관련 파일들이 여기에 표시됩니다
-```
-
-## GridFile 블록 정보
-- **배치 존**: active (활성 개발)
-- **블록 크기**: 표준 (2x2)
-- **색상**: 빨간색 (활성 프로젝트)
-
-## 테스트 계획
-- [ ] 단위 테스트 작성
-- [ ] 통합 테스트 작성
-- [ ] 사용자 테스트 계획
-
-## 완료 체크리스트
-- [ ] 코드 구현 완료
-- [ ] 테스트 통과
-- [ ] 문서 업데이트
-- [ ] 코드 리뷰 완료
-- [ ] 배포 완료
-
-## 회고
-*완료 후 작성*
-"""
+        now = datetime.datetime.now()
+        ledger_content = LEDGER_TEMPLATE.substitute(
+            feature_name=feature_name,
+            created_at=now.strftime('%Y-%m-%d %H:%M:%S'),
+            date=now.strftime('%Y-%m-%d'),
+            description=description or '- TBD'
+        )
         
         # 원장 파일 생성
-        with open(ledger_path, "w", encoding="utf-8") as f:
-            f.write(ledger_content)
+        _write_text(ledger_path, ledger_content)
+        self._features_cache.clear()
         
         self._update_active_dashboard()
         self._log_success(f"'{feature_name}' 기능 원장이 생성되었습니다: {ledger_path}")
@@ -660,17 +1441,16 @@ MAX_RETRY_COUNT = 3
     
     def _update_active_dashboard(self) -> None:
         """활성 기능 대시보드 업데이트"""
-        active_ledgers = list((self.ai_dir / "ledgers" / "active").glob("*.md"))
-        active_features = []
-        
-        for ledger in active_ledgers:
-            if ledger.name != "_active.md":
-                active_features.append(ledger.stem)
+        active_features = [
+            entry.name[:-3] for entry in _scan_ledgers(self.ai_dir / "ledgers" / "active")
+            if entry.name != "_active.md"
+        ]
         
+        now = datetime.datetime.now()
         dashboard_content = f"""# 활성 기능 대시보드
 
 ## 현재 개발 중인 기능
-*마지막 업데이트: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*
+*마지막 업데이트: {now.strftime('%Y-%m-%d %H:%M:%S')}*
 
 """
         
@@ -690,12 +1470,11 @@ MAX_RETRY_COUNT = 3
 - **그리드 효율성**: {min(100, len(active_features) * 10)}%
 
 ## 최근 활동
-- {datetime.datetime.now().strftime('%Y-%m-%d')}: 대시보드 업데이트
+- {now.strftime('%Y-%m-%d')}: 대시보드 업데이트
 """
         
         dashboard_path = self.ai_dir / "ledgers" / "_active.md"
-        with open(dashboard_path, "w", encoding="utf-8") as f:
-            f.write(dashboard_content)
+        _write_text(dashboard_path, dashboard_content)
         
         self._log_debug("활성 기능 대시보드 업데이트 완료")
     
@@ -709,32 +1488,39 @@ MAX_RETRY_COUNT = 3
         Returns:
             List[Dict]: 기능 목록 (이름, 상태, 경로 포함)
         """
+        cached = self._features_cache.get(include_archived)
+        if cached is not None:
+            return cached
+        
         if not self.is_initialized():
             self._log_error("GridWrinkl이 초기화되지 않았습니다. 먼저 'gridwrinkl init' 명령을 실행하세요.")
             return []
         
-        features = []
-        
         # 활성 기능 조회
-        for ledger_path in (self.ai_dir / "ledgers" / "active").glob("*.md"):
-            if ledger_path.name == "_active.md":
-                continue
-                
-            features.append({
-                "name": ledger_path.stem,
+        active_dir = os.path.join(".ai", "ledgers", "active")
+        features = [
+            {
+                "name": entry.name[:-3],
                 "status": "active",
-                "path": str(ledger_path.relative_to(self.project_path))
-            })
+                "path": os.path.join(active_dir, entry.name)
+            }
+            for entry in _scan_ledgers(self.project_path / active_dir)
+            if entry.name != "_active.md"
+        ]
         
         # 아카이브된 기능 조회
         if include_archived:
-            for ledger_path in (self.ai_dir / "ledgers" / "archived").glob("*.md"):
-                features.append({
-                    "name": ledger_path.stem,
+            archived_dir = os.path.join(".ai", "ledgers", "archived")
+            features.extend(
+                {
+                    "name": entry.name[:-3],
                     "status": "archived",
-                    "path": str(ledger_path.relative_to(self.project_path))
-                })
+                    "path": os.path.join(archived_dir, entry.name)
+                }
+                for entry in _scan_ledgers(self.project_path / archived_dir)
+            )
         
+        self._features_cache[include_archived] = features
         return features
     
     def archive_feature(self, feature_name: str) -> bool:
@@ -752,7 +1538,7 @@ MAX_RETRY_COUNT = 3
             return False
         
         # 기능명 정규화
-        feature_name = feature_name.replace("-", "_")
+        feature_name = self._normalize(feature_name)
         
         active_path = self.ai_dir / "ledgers" / "active" / f"{feature_name}.md"
         archived_path = self.ai_dir / "ledgers" / "archived" / f"{feature_name}.md"
@@ -764,8 +1550,7 @@ MAX_RETRY_COUNT = 3
         self._log_info(f"'{feature_name}' 기능을 아카이브합니다...")
         
         # 원장 파일 내용 읽기
-        with open(active_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        content = active_path.read_text(encoding="utf-8")
         
         # 아카이브 정보 추가
         archive_info = f"""
@@ -777,11 +1562,11 @@ MAX_RETRY_COUNT = 3
 """
         
         # 아카이브 파일 생성
-        with open(archived_path, "w", encoding="utf-8") as f:
-            f.write(content + archive_info)
+        _write_text(archived_path, content + archive_info)
         
         # 활성 파일 삭제
         active_path.unlink()
+        self._features_cache.clear()
         
         self._update_active_dashboard()
         self._log_success(f"'{feature_name}' 기능이 아카이브되었습니다.")
@@ -822,18 +1607,19 @@ MAX_RETRY_COUNT = 3
         for file_name in ai_files:
             src_path = self.ai_dir / file_name
             if src_path.exists():
-                shutil.copy2(src_path, snapshot_dir)
+                _fast_copy(src_path, snapshot_dir / file_name)
         
-        # 활성 기능 원장 복사
+        # 활성 기능 원장 복사 (DirEntry의 stat으로 복사 크기 결정)
         ledgers_dir = snapshot_dir / "ledgers"
         ledgers_dir.mkdir(exist_ok=True)
         
-        for ledger_path in (self.ai_dir / "ledgers" / "active").glob("*.md"):
-            shutil.copy2(ledger_path, ledgers_dir)
+        for entry in _scan_ledgers(self.ai_dir / "ledgers" / "active"):
+            if entry.is_file():
+                _fast_copy(entry.path, ledgers_dir / entry.name, entry.stat().st_size)
         
         # 그리드 레이아웃 복사
         if (self.gridfile_dir / "layouts" / "current.json").exists():
-            shutil.copy2(
+            _fast_copy(
                 self.gridfile_dir / "layouts" / "current.json", 
                 snapshot_dir / "grid-layout.json"
             )
@@ -855,14 +1641,9 @@ MAX_RETRY_COUNT = 3
         self._log_info("AI 도구 설정 파일을 현재 맥락과 동기화합니다...")
         
         # 프로젝트 설정 로드
-        if not self.config:
-            config_path = self.gridfile_dir / "config.json"
-            if config_path.exists():
-                with open(config_path, "r", encoding="utf-8") as f:
-                    self.config = json.load(f)
-            else:
-                self._log_error("설정 파일을 찾을 수 없습니다.")
-                return False
+        if self._load_config() is None:
+            self._log_error("설정 파일을 찾을 수 없습니다.")
+            return False
         
         project_name = self.config.get("project_name", "Project")
         ai_tools = self.config.get("ai_tools", ["cursor", "copilot"])
@@ -880,96 +1661,64 @@ MAX_RETRY_COUNT = 3
         
         # 도구별 설정 파일 업데이트
         updated_tools = []
+        unchanged_tools = []
         
         for tool in supported_tools:
             if tool == "cursor":
-                self._update_cursor_rules(project_name, feature_names)
-                updated_tools.append("cursor")
+                changed = self._update_cursor_rules(project_name, feature_names)
             elif tool == "copilot":
-                self._update_copilot_instructions(project_name, feature_names)
-                updated_tools.append("copilot")
+                changed = self._update_copilot_instructions(project_name, feature_names)
+            else:
+                continue
+            
+            if changed:
+                updated_tools.append(tool)
+            else:
+                unchanged_tools.append(tool)
         
         if updated_tools:
             self._log_success(f"다음 AI 도구 설정이 업데이트되었습니다: {', '.join(updated_tools)}")
-            return True
-        else:
+        if unchanged_tools:
+            self._log_info(f"다음 AI 도구 설정은 이미 최신 상태입니다: {', '.join(unchanged_tools)}")
+        
+        if not updated_tools and not unchanged_tools:
             self._log_warning("업데이트된 AI 도구 설정이 없습니다.")
             return False
+        
+        return True
     
-    def _update_cursor_rules(self, project_name: str, features: List[str]) -> None:
-        """Cursor AI 규칙 업데이트"""
-        cursor_rules = f"""# {project_name} - Cursor AI 규칙
-# [자동 생성됨: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M')}]
-
-## 프로젝트 맥락
-이 프로젝트는 GridFile-Wrinkl 하이브리드 시스템을 사용합니다.
-
-## 현재 작업 중인 기능
-{', '.join(features) if features else "현재 작업 중인 기능이 없습니다."}
-
-## 필수 확인사항
-1. .ai/ledgers/에서 현재 작업 중인 기능 확인
-2. .ai/patterns.md의 코딩 패턴 준수
-3. .ai/context-rules.md의 가이드라인 준수
-
-## 파일 작업 시
-- 새 파일 생성 시 GridFile 블록 할당 고려
-- 기능별로 일관된 디렉토리 구조 유지
-- 변경사항을 해당 기능의 ledger에 기록
-
-## 코드 스타일
-- 주석: 한국어
-- 함수명: snake_case
-- 클래스명: PascalCase
-- 타입 힌트 필수
-
-## 금지사항
-- 전역 변수 남용
-- 매직 넘버 사용
-- 과도한 중첩 (3단계 이상)
-- 테스트 없는 코드 작성
-"""
+    def _update_cursor_rules(self, project_name: str, features: List[str]) -> bool:
+        """
+        Cursor AI 규칙 업데이트
+        
+        Returns:
+            bool: 파일 내용이 바뀌어 다시 썼는지 여부
+        """
+        cursor_rules = CURSOR_RULES_SYNC_TEMPLATE.substitute(
+            project_name=project_name,
+            generated_at=datetime.datetime.now().strftime('%Y-%m-%d %H:%M'),
+            features=", ".join(features) if features else "현재 작업 중인 기능이 없습니다."
+        )
         
-        with open(self.project_path / ".cursorrules", "w", encoding="utf-8") as f:
-            f.write(cursor_rules)
+        return _write_text_if_changed(self.project_path / ".cursorrules", cursor_rules)
     
-    def _update_copilot_instructions(self, project_name: str, features: List[str]) -> None:
-        """GitHub Copilot 지침 업데이트"""
+    def _update_copilot_instructions(self, project_name: str, features: List[str]) -> bool:
+        """
+        GitHub Copilot 지침 업데이트
+        
+        Returns:
+            bool: 파일 내용이 바뀌어 다시 썼는지 여부
+        """
         github_dir = self.project_path / ".github"
         github_dir.mkdir(exist_ok=True)
         
-        copilot_instructions = f"""# {project_name} - GitHub Copilot 지침
-# [자동 생성됨: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M')}]
-
-이 프로젝트는 GridFile-Wrinkl 통합 시스템을 사용합니다.
-
-## 현재 작업 중인 기능
-{', '.join(features) if features else "현재 작업 중인 기능이 없습니다."}
-
-## 작업 전 체크리스트
-- [ ] .ai/ledgers/에서 현재 기능 컨텍스트 확인
-- [ ] .ai/patterns.md의 코딩 패턴 검토
-- [ ] .ai/architecture.md의 설계 원칙 확인
-
-## 코드 생성 가이드라인
-- 한국어 주석 사용
-- 타입 힌트 포함
-- 에러 처리 구현
-- 테스트 코드 생성
-
-## 파일 관리
-- 새 파일은 적절한 GridFile 존에 배치
-- 기능별 디렉토리 구조 유지
-- 임시 파일은 .tmp/ 사용
-
-## 문서화
-- 함수 docstring 필수
-- 복잡한 로직은 인라인 주석
-- 변경사항을 ledger에 기록
-"""
+        copilot_instructions = COPILOT_INSTRUCTIONS_SYNC_TEMPLATE.substitute(
+            project_name=project_name,
+            generated_at=datetime.datetime.now().strftime('%Y-%m-%d %H:%M'),
+            features=", ".join(features) if features else "현재 작업 중인 기능이 없습니다."
+        )
         
-        with open(github_dir / "copilot-instructions.md", "w", encoding="utf-8") as f:
-            f.write(copilot_instructions)
+        return _write_text_if_changed(github_dir / "copilot-instructions.md", copilot_instructions)
 
     def grid_reorganize(self) -> bool:
         """
@@ -994,8 +1743,7 @@ MAX_RETRY_COUNT = 3
             self._log_error("그리드 레이아웃 파일을 찾을 수 없습니다.")
             return False
         
-        with open(layout_path, "r", encoding="utf-8") as f:
-            layout = json.load(f)
+        layout = _read_json(layout_path)
         
         # 그리드 크기 확인
         grid_size = layout.get("grid_size", {"width": 12, "height": 8})
@@ -1007,59 +1755,47 @@ MAX_RETRY_COUNT = 3
         
         # 블록 목록과 상태 확인
         blocks = layout.get("blocks", [])
-        old_placed = sum(1 for block in blocks if block.get("placed", False))
+        old_placed = 0
+        for block in blocks:
+            old_placed += block.get("placed", False)
         
         # 블록 재배치
         self._log_info("블록을 재배치하여 그리드 효율성을 개선합니다...")
-        new_blocks = self._reorganize_blocks(blocks, zones, grid_size)
+        new_blocks, new_placed = self._reorganize_blocks(blocks, zones, grid_size)
         
         # 새 레이아웃 저장
+        now = datetime.datetime.now()
         new_layout = {
             "version": "1.0.0",
-            "timestamp": datetime.datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "grid_size": grid_size,
             "zones": zones,
             "blocks": new_blocks,
             "stats": {
                 "total_files": len(new_blocks),
-                "placed_files": sum(1 for block in new_blocks if block.get("placed", False)),
+                "placed_files": new_placed,
                 "by_category": {},
                 "by_type": {}
             }
         }
         
         # 통계 업데이트
-        category_counts = {}
-        type_counts = {}
-        
-        for block in new_blocks:
-            category = block["category"]
-            file_type = block["type"]
-            
-            if category in category_counts:
-                category_counts[category] += 1
-            else:
-                category_counts[category] = 1
-                
-            if file_type in type_counts:
-                type_counts[file_type] += 1
-            else:
-                type_counts[file_type] = 1
-        
-        new_layout["stats"]["by_category"] = category_counts
-        new_layout["stats"]["by_type"] = type_counts
+        new_layout["stats"]["by_category"] = _count_labels(
+            [block["category"] for block in new_blocks], _CATEGORY_CODES
+        )
+        new_layout["stats"]["by_type"] = _count_labels(
+            [block["type"] for block in new_blocks], _TYPE_CODES
+        )
         
         # 이전 레이아웃 백업
         if layout_path.exists():
-            backup_path = self.gridfile_dir / "backups" / f"layout-{datetime.datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
-            shutil.copy2(layout_path, backup_path)
+            backup_path = self.gridfile_dir / "backups" / f"layout-{now.strftime('%Y%m%d-%H%M%S')}.json"
+            _fast_copy(layout_path, backup_path)
         
         # 새 레이아웃 저장
-        with open(self.gridfile_dir / "layouts" / "current.json", "w", encoding="utf-8") as f:
-            json.dump(new_layout, f, indent=2, ensure_ascii=False)
+        _write_json(self.gridfile_dir / "layouts" / "current.json", new_layout)
         
         # 개선 사항 로깅
-        new_placed = sum(1 for block in new_blocks if block.get("placed", False))
         if len(blocks) > 0:
             old_efficiency = old_placed / len(blocks) * 100
             new_efficiency = new_placed / len(blocks) * 100
@@ -1069,64 +1805,182 @@ MAX_RETRY_COUNT = 3
         
         return True
     
-    def _reorganize_blocks(self, blocks: List[Dict], zones: Dict, grid_size: Dict) -> List[Dict]:
-        """블록 재배치 최적화"""
-        # 그리드 점유 상태 초기화
-        grid = [[False for _ in range(grid_size["width"])] for _ in range(grid_size["height"])]
+    def grid_add_block(self, file_path: str) -> bool:
+        """
+        전체 재구성 없이 현재 레이아웃에 파일 블록 하나 추가
         
-        # 블록 카테고리별 분류
-        categorized_blocks = {}
-        for block in blocks:
-            category = block["category"]
-            if category not in categorized_blocks:
-                categorized_blocks[category] = []
-            categorized_blocks[category].append(block.copy())
-        
-        # 모든 블록을 미배치 상태로 초기화
-        for blocks_list in categorized_blocks.values():
-            for block in blocks_list:
-                block["placed"] = False
-                if "position" in block:
-                    del block["position"]
+        블록은 해당 영역의 스카이라인에서 가장 낮은 자리에 놓이며,
+        기존 블록의 위치는 바뀌지 않습니다.
         
-        # 영역별로 블록 배치
-        for category, blocks_list in categorized_blocks.items():
-            zone_name = self.category_to_zone.get(category, "archive")
-            if zone_name in zones:
-                zone = zones[zone_name]
-                self._place_blocks_in_zone(blocks_list, zone, grid)
+        Args:
+            file_path: 추가할 파일 경로 (상대 경로는 프로젝트 기준)
+            
+        Returns:
+            bool: 추가 성공 여부
+        """
+        if not self.is_initialized():
+            self._log_error("GridWrinkl이 초기화되지 않았습니다. 먼저 'gridwrinkl init' 명령을 실행하세요.")
+            return False
         
-        # 모든 블록 병합하여 반환
-        result_blocks = []
-        for blocks_list in categorized_blocks.values():
-            result_blocks.extend(blocks_list)
+        current_layout_path = self.gridfile_dir / "layouts" / "current.json"
+        initial_layout_path = self.gridfile_dir / "layouts" / "initial.json"
         
-        return result_blocks
-    
-    def _place_blocks_in_zone(self, blocks: List[Dict], zone: Dict, grid: List[List[bool]]) -> None:
-        """특정 영역에 블록 배치"""
-        zone_x, zone_y = zone["x"], zone["y"]
-        zone_w, zone_h = zone["width"], zone["height"]
+        layout_path = current_layout_path if current_layout_path.exists() else initial_layout_path
         
-        # 영역 내 좌표 순회
-        for y in range(zone_y, zone_y + zone_h):
-            for x in range(zone_x, zone_x + zone_w):
-                if y >= len(grid) or x >= len(grid[0]):
-                    continue
-                    
-                # 이미 점유된 셀이면 건너뛰기
-                if grid[y][x]:
-                    continue
-                
-                # 배치할 블록이 없으면 종료
-                if not blocks:
-                    return
-                
-                # 다음 블록 배치
-                block = blocks.pop(0)
+        if not layout_path.exists():
+            self._log_error("그리드 레이아웃 파일을 찾을 수 없습니다.")
+            return False
+        
+        root = str(self.project_path_resolved)
+        file_path = os.path.normpath(os.path.join(root, file_path))
+        
+        # 초기 스캔(_walk)이 수집하는 파일만 허용
+        rel_path = os.path.relpath(file_path, root)
+        if rel_path == os.pardir or rel_path.startswith(os.pardir + os.sep):
+            self._log_error(f"프로젝트 밖의 파일은 추가할 수 없습니다: {file_path}")
+            return False
+        
+        if any(part in IGNORE_NAMES for part in Path(rel_path).parts):
+            self._log_error(f"무시 대상 경로의 파일은 추가할 수 없습니다: {rel_path}")
+            return False
+        
+        try:
+            stats = os.stat(file_path)
+        except FileNotFoundError:
+            self._log_error(f"파일을 찾을 수 없습니다: {file_path}")
+            return False
+        
+        if not stat.S_ISREG(stats.st_mode):
+            self._log_error(f"일반 파일이 아닙니다: {rel_path}")
+            return False
+        
+        layout = _read_json(layout_path)
+        blocks = layout.setdefault("blocks", [])
+        
+        block = self._file_block(file_path, stats, root, datetime.datetime.now().timestamp())
+        if any(existing["path"] == block["path"] for existing in blocks):
+            self._log_warning(f"'{block['path']}' 블록이 이미 레이아웃에 있습니다.")
+            return False
+        
+        grid_size = layout.get("grid_size", {"width": 12, "height": 8})
+        zones = layout.get("zones", {})
+        zone_name = self.category_to_zone.get(block["category"], "archive")
+        
+        if zone_name in zones:
+            placed_rects = [
+                (b["position"]["x"], b["position"]["y"], b.get("width", 1), b.get("height", 1))
+                for b in blocks if b.get("placed", False)
+            ]
+            skyline = _SkylineState.from_rects(zones[zone_name], grid_size, placed_rects)
+            position = skyline.insert(block.get("width", 1), block.get("height", 1))
+            if position is not None:
                 block["placed"] = True
-                block["position"] = {"x": x, "y": y}
-                grid[y][x] = True
+                block["position"] = {"x": position[0], "y": position[1]}
+        
+        blocks.append(block)
+        
+        # 통계 갱신
+        stats_info = layout.setdefault("stats", {})
+        stats_info["total_files"] = len(blocks)
+        stats_info["placed_files"] = stats_info.get("placed_files", 0) + block["placed"]
+        for key, label in (("by_category", block["category"]), ("by_type", block["type"])):
+            counts = stats_info.setdefault(key, {})
+            counts[label] = counts.get(label, 0) + 1
+        layout["timestamp"] = datetime.datetime.now().isoformat()
+        
+        _write_json(current_layout_path, layout)
+        
+        if block["placed"]:
+            self._log_success(f"'{block['path']}' 블록을 ({block['position']['x']}, {block['position']['y']})에 배치했습니다.")
+        elif zone_name not in zones:
+            self._log_warning(f"'{block['path']}' 블록을 추가했지만 레이아웃에 '{zone_name}' 영역이 없어 배치하지 않았습니다.")
+        else:
+            self._log_warning(f"'{block['path']}' 블록을 추가했지만 '{zone_name}' 영역에 빈 자리가 없습니다.")
+        
+        return True
+    
+    def _reorganize_blocks(self, blocks: Sequence[Mapping], zones: Dict, grid_size: Dict) -> Tuple[List[Dict], int]:
+        """
+        블록 재배치 최적화
+        
+        Returns:
+            Tuple[List[Dict], int]: 재배치된 블록 목록과 배치된 블록 수
+        """
+        # 배치 상태는 블록 사전 대신 블록 인덱스 기준의 병렬 목록에 기록
+        n = len(blocks)
+        widths = [block.get("width", 1) for block in blocks]
+        heights = [block.get("height", 1) for block in blocks]
+        placed = [False] * n
+        pos_x = [-1] * n
+        pos_y = [-1] * n
+        
+        # 블록 인덱스 카테고리별 분류
+        categorized_blocks: Dict[str, List[int]] = defaultdict(list)
+        get_category = itemgetter("category")
+        for i, block in enumerate(blocks):
+            categorized_blocks[get_category(block)].append(i)
+        
+        # 영역별 빈 사각형 목록 (같은 영역을 쓰는 카테고리끼리 공유)
+        free_rects_by_zone: Dict[str, List[Tuple[int, int, int, int]]] = {}
+        placed_rects: List[Tuple[int, int, int, int]] = []
+        
+        cat_to_zone = self.category_to_zone
+        default_zone = "archive"
+        
+        # 배치 순서용 긴 변 길이 (큰 블록부터 배치, First-Fit-Decreasing)
+        max_sides = [max(w, h) for w, h in zip(widths, heights)]
+        
+        # 영역별로 블록 배치
+        for category, indices in categorized_blocks.items():
+            zone_name = cat_to_zone.get(category, default_zone)
+            if zone_name not in zones:
+                continue
+            
+            free_rects = free_rects_by_zone.get(zone_name)
+            if free_rects is None:
+                zone = zones[zone_name]
+                # 영역을 그리드 경계로 잘라냄
+                zone_w = min(zone["x"] + zone["width"], grid_size["width"]) - zone["x"]
+                zone_h = min(zone["y"] + zone["height"], grid_size["height"]) - zone["y"]
+                free_rects = [(zone["x"], zone["y"], zone_w, zone_h)] if zone_w > 0 and zone_h > 0 else []
+                # 겹치는 영역에 이미 배치된 블록 자리는 제외
+                for rect in placed_rects:
+                    _split_free_rect_list(free_rects, *rect)
+                free_rects_by_zone[zone_name] = free_rects
+            
+            # 영역이 가득 찼으면 남은 블록은 미배치로 둠
+            if not free_rects:
+                continue
+            
+            # 긴 변 내림차순으로 배치 (같으면 원래 순서, 결과 목록 순서는 유지)
+            order = sorted(indices, key=lambda i: -max_sides[i])
+            if _numba_available() and len(order) * len(free_rects) > _JIT_PLACEMENT_THRESHOLD:
+                _place_with_kernel(free_rects, order, widths, heights, placed, pos_x, pos_y)
+            else:
+                _place_in_free_rect_list(free_rects, order, widths, heights, placed, pos_x, pos_y)
+            
+            # 겹치는 다른 영역의 빈 사각형에도 반영
+            new_rects = [(pos_x[i], pos_y[i], widths[i], heights[i]) for i in order if placed[i]]
+            if not new_rects:
+                continue
+            for other_name, other_rects in free_rects_by_zone.items():
+                if other_name != zone_name:
+                    for rect in new_rects:
+                        _split_free_rect_list(other_rects, *rect)
+            placed_rects.extend(new_rects)
+        
+        # 카테고리 순서대로 배치 결과를 블록 사전에 반영하여 반환
+        placed_count = sum(placed)
+        result_blocks = []
+        for i in itertools.chain.from_iterable(categorized_blocks.values()):
+            block = {**blocks[i], "placed": placed[i]}
+            if placed[i]:
+                block["position"] = {"x": pos_x[i], "y": pos_y[i]}
+            else:
+                block.pop("position", None)
+            result_blocks.append(block)
+        
+        return result_blocks, placed_count
     
     def ui(self, port: int = 3000) -> None:
         """
@@ -1147,8 +2001,10 @@ MAX_RETRY_COUNT = 3
         print("\n실제 웹 UI 구현은 현재 준비 중입니다.\n")
 
 
-def create_parser() -> argparse.ArgumentParser:
+def create_parser() -> "argparse.ArgumentParser":
     """명령줄 인터페이스 파서 생성"""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         prog="gridwrinkl",
         description="GridWrinkl CLI - GridFile과 Wrinkl 시스템을 통합한 개발 생산성 도구",
@@ -1248,6 +2104,10 @@ def create_parser() -> argparse.ArgumentParser:
     # grid reorganize
     grid_reorganize_parser = grid_subparsers.add_parser("reorganize", help="그리드 재구성")
     
+    # grid add
+    grid_add_parser = grid_subparsers.add_parser("add", help="재구성 없이 파일 블록 추가")
+    grid_add_parser.add_argument("file_path", help="추가할 파일 경로")
+    
     # ui 명령
     ui_parser = subparsers.add_parser("ui", help="그래픽 UI 시작")
     ui_parser.add_argument(
@@ -1260,7 +2120,7 @@ def create_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def handle_feature_command(gridwrinkl: GridWrinkl, args: argparse.Namespace) -> None:
+def handle_feature_command(gridwrinkl: GridWrinkl, args: "argparse.Namespace") -> None:
     """feature 명령 처리"""
     if args.feature_command == "create":
         gridwrinkl.create_feature(
@@ -1273,23 +2133,25 @@ def handle_feature_command(gridwrinkl: GridWrinkl, args: argparse.Namespace) ->
         features = gridwrinkl.list_features(args.all)
         
         if args.json:
-            print(json.dumps(features, indent=2))
+            _print_json(features)
         else:
             print("\n현재 기능 목록:")
             
             if not features:
                 print("  기능이 없습니다.")
             else:
+                # --no-color와 터미널 여부를 반영한 색상 설정 사용
+                if gridwrinkl.color_enabled:
+                    active_text, archived_text = ConsoleColors.GREEN_ACTIVE, ConsoleColors.YELLOW_ARCHIVED
+                else:
+                    active_text, archived_text = "활성", "아카이브됨"
+                
+                # 목록 전체를 모아 한 번에 출력
+                lines = []
                 for feature in features:
-                    status_color = ConsoleColors.GREEN if feature["status"] == "active" else ConsoleColors.YELLOW
-                    status_text = "활성" if feature["status"] == "active" else "아카이브됨"
-                    
-                    if not args.no_color:
-                        print(f"  • {feature['name']} ({status_color}{status_text}{ConsoleColors.ENDC})")
-                        print(f"    경로: {feature['path']}")
-                    else:
-                        print(f"  • {feature['name']} ({status_text})")
-                        print(f"    경로: {feature['path']}")
+                    status_text = active_text if feature["status"] == "active" else archived_text
+                    lines.append(f"  • {feature['name']} ({status_text})\n    경로: {feature['path']}\n")
+                sys.stdout.write("".join(lines))
     
     elif args.feature_command == "archive":
         gridwrinkl.archive_feature(args.feature_name)
@@ -1299,7 +2161,7 @@ def handle_feature_command(gridwrinkl: GridWrinkl, args: argparse.Namespace) ->
         gridwrinkl.create_feature(args.feature_name)
 
 
-def handle_context_command(gridwrinkl: GridWrinkl, args: argparse.Namespace) -> None:
+def handle_context_command(gridwrinkl: GridWrinkl, args: "argparse.Namespace") -> None:
     """context 명령 처리"""
     if args.context_command == "snapshot":
         gridwrinkl.context_snapshot(args.name)
@@ -1311,11 +2173,14 @@ def handle_context_command(gridwrinkl: GridWrinkl, args: argparse.Namespace) ->
         gridwrinkl._log_error("알 수 없는 context 하위 명령입니다.")
 
 
-def handle_grid_command(gridwrinkl: GridWrinkl, args: argparse.Namespace) -> None:
+def handle_grid_command(gridwrinkl: GridWrinkl, args: "argparse.Namespace") -> None:
     """grid 명령 처리"""
     if args.grid_command == "reorganize":
         gridwrinkl.grid_reorganize()
     
+    elif args.grid_command == "add":
+        gridwrinkl.grid_add_block(args.file_path)
+    
     else:
         gridwrinkl._log_error("알 수 없는 grid 하위 명령입니다.")
 
@@ -3,12 +3,83 @@
 from flask import Flask, render_template, request, redirect, url_for, flash
 import json
 import os
+from pathlib import Path
+from typing import Dict, Optional, Tuple
 from user_authentication import services
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
 app = Flask(__name__)
 # flash 메시지를 사용하려면 secret_key가 필요합니다.
 app.secret_key = 'supersecretkey'
 
+# 정적 파일 브라우저 캐시 시간 (초)
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 3600
+
+# 응답 압축 (flask-compress가 설치되어 있으면 gzip/Brotli 적용)
+app.config['COMPRESS_MIMETYPES'] = ['application/json', 'text/html', 'text/css', 'application/javascript']
+app.config['COMPRESS_LEVEL'] = 6
+if Compress is not None:
+    Compress(app)
+
+# 그리드 레이아웃 파일 경로 (current.json이 없으면 initial.json을 사용)
+_LAYOUTS_DIR = Path(__file__).resolve().parent.parent / '.gridfile' / 'layouts'
+_LAYOUT_CURRENT = _LAYOUTS_DIR / 'current.json'
+_LAYOUT_INITIAL = _LAYOUTS_DIR / 'initial.json'
+
+# 레이아웃 파일 경로별 ((수정 시각 ns, 파일 크기), 직렬화된 JSON 문자열) 캐시
+_layout_cache: Dict[Path, Tuple[Tuple[int, int], str]] = {}
+
+def _load_layout_json() -> Optional[str]:
+    """
+    레이아웃 파일을 읽어 템플릿에 넘길 JSON 문자열로 반환합니다.
+    파일이 바뀌지 않았으면 캐시된 문자열을 그대로 사용합니다.
+
+    Returns:
+        한 줄로 직렬화된 JSON 문자열 (레이아웃 파일이 없으면 None)
+    """
+    for layout_path in (_LAYOUT_CURRENT, _LAYOUT_INITIAL):
+        try:
+            st = os.stat(layout_path)
+        except FileNotFoundError:
+            continue
+        return _read_layout_json(layout_path, (st.st_mtime_ns, st.st_size))
+    return None
+
+def _read_layout_json(layout_path: Path, version: Tuple[int, int]) -> str:
+    """
+    레이아웃 파일 하나를 직렬화된 JSON 문자열로 읽습니다 (수정 시각/크기 기준 캐시).
+
+    Args:
+        layout_path: 레이아웃 JSON 파일 경로
+        version: 파일의 (st_mtime_ns, st_size)
+
+    Returns:
+        한 줄로 직렬화된 JSON 문자열
+    """
+    cached = _layout_cache.get(layout_path)
+    if cached and cached[0] == version:
+        return cached[1]
+
+    with open(layout_path, 'rb') as f:
+        raw = f.read()
+    # 템플릿의 JavaScript 문자열 리터럴 안에 들어가므로 한 줄로 다시 직렬화
+    # (orjson이 설치되어 있으면 orjson 사용)
+    if orjson is not None:
+        layout_json = orjson.dumps(orjson.loads(raw)).decode('utf-8')
+    else:
+        layout_json = json.dumps(json.loads(raw))
+    _layout_cache[layout_path] = (version, layout_json)
+    return layout_json
+
 @app.route('/')
 def index():
     """
@@ -62,17 +133,11 @@ def grid_view():
     """
     GridFile 시스템을 시각화하여 보여줍니다.
     """
-    layout_path = os.path.join(os.path.dirname(__file__), '..', '.gridfile', 'layouts', 'current.json')
-    
-    if not os.path.exists(layout_path):
-        # current.json이 없으면 initial.json을 사용
-        layout_path = os.path.join(os.path.dirname(__file__), '..', '.gridfile', 'layouts', 'initial.json')
-
-    if os.path.exists(layout_path):
-        with open(layout_path, 'r', encoding='utf-8') as f:
-            layout_data = json.load(f)
+    layout_json = _load_layout_json()
+
+    if layout_json is not None:
         # Pass the layout data as a JSON string for easy use in JavaScript
-        return render_template('grid.html', layout_json=json.dumps(layout_data))
+        return render_template('grid.html', layout_json=layout_json)
     else:
         flash('Grid layout 파일을 찾을 수 없습니다.', 'error')
         return redirect(url_for('login'))
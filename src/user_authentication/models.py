@@ -1,9 +1,13 @@
 # -*- coding: utf-8 -*-
 
 from dataclasses import dataclass, field
+import sys
 import uuid
 
-@dataclass
+# Python 3.10 이상에서는 __slots__를 사용해 인스턴스별 __dict__를 없앱니다.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class User:
     """
     사용자 정보를 나타내는 데이터 클래스
@@ -1,16 +1,30 @@
 # -*- coding: utf-8 -*-
 
+import hashlib
+import hmac
+import os
+from functools import lru_cache
 from typing import Dict, Optional
 from .models import User
 
 # 데이터베이스를 흉내 내기 위한 임시 저장소
 _users_db: Dict[str, User] = {}
+# 이메일로 사용자 ID를 찾기 위한 보조 인덱스
+_email_to_id: Dict[str, str] = {}
 
-# 비밀번호 해싱을 위한 간단한 모의 함수
+# 개발용 해시 키
+_SECRET = b"gridwrinkl-dev-key"
+
+# 비밀번호 해싱을 위한 간단한 함수 (키 지정 BLAKE2b)
 # 실제 애플리케이션에서는 bcrypt나 argon2와 같은 강력한 라이브러리를 사용해야 합니다.
 def _hash_password(password: str) -> str:
-    """간단한 비밀번호 해싱 흉내"""
-    return f"hashed_{password}"
+    """간단한 비밀번호 해싱"""
+    return hashlib.blake2b(password.encode("utf-8"), digest_size=16, key=_SECRET).hexdigest()
+
+# 개발 모드(GW_DEV)에서만 해시 결과를 캐시합니다.
+# 비밀번호를 프로세스 메모리에 보관하게 되므로 운영 환경에서는 사용하지 않습니다.
+if os.environ.get("GW_DEV"):
+    _hash_password = lru_cache(maxsize=1024)(_hash_password)
 
 def create_user(username: str, email: str, password: str) -> User:
     """
@@ -24,7 +38,7 @@ def create_user(username: str, email: str, password: str) -> User:
     Returns:
         생성된 User 객체
     """
-    if email in [user.email for user in _users_db.values()]:
+    if email in _email_to_id:
         raise ValueError("이미 사용 중인 이메일입니다.")
 
     hashed_password = _hash_password(password)
@@ -34,6 +48,7 @@ def create_user(username: str, email: str, password: str) -> User:
         hashed_password=hashed_password
     )
     _users_db[new_user.id] = new_user
+    _email_to_id[email] = new_user.id
     return new_user
 
 def get_user_by_email(email: str) -> Optional[User]:
@@ -46,10 +61,8 @@ def get_user_by_email(email: str) -> Optional[User]:
     Returns:
         찾은 User 객체 또는 None
     """
-    for user in _users_db.values():
-        if user.email == email:
-            return user
-    return None
+    user_id = _email_to_id.get(email)
+    return _users_db.get(user_id) if user_id else None
 
 def verify_password(password: str, hashed_password: str) -> bool:
     """
@@ -62,4 +75,4 @@ def verify_password(password: str, hashed_password: str) -> bool:
     Returns:
         비밀번호 일치 여부
     """
-    return _hash_password(password) == hashed_password
+    return hmac.compare_digest(_hash_password(password), hashed_password)
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+# Add the repository root to the Python path to import the CLI module
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gridwrinkl_cli import GridWrinkl
+
+
+class TestFeatureLedgers(unittest.TestCase):
+    """
+    기능 원장 조회에 대한 테스트 케이스
+    """
+
+    def setUp(self):
+        """
+        각 테스트 전에 실행되는 설정 메서드
+        - 활성 원장 하나만 있고 archived/ 디렉토리는 없는 프로젝트를 만듭니다.
+          (git은 빈 디렉토리를 추적하지 않음)
+        """
+        self._tmp = tempfile.TemporaryDirectory()
+        self.project = Path(self._tmp.name)
+        (self.project / ".gridfile").mkdir()
+        (self.project / ".gridfile" / "config.json").write_text("{}", encoding="utf-8")
+        active_dir = self.project / ".ai" / "ledgers" / "active"
+        active_dir.mkdir(parents=True)
+        (active_dir / "user_authentication.md").write_text("# user_authentication\n", encoding="utf-8")
+        self.gridwrinkl = GridWrinkl(str(self.project))
+
+    def tearDown(self):
+        """각 테스트 후 임시 프로젝트 삭제"""
+        self._tmp.cleanup()
+
+    def test_list_features_without_archived_dir(self):
+        """
+        archived/ 디렉토리가 없어도 아카이브 포함 목록 조회가 성공하는지 테스트
+        """
+        features = self.gridwrinkl.list_features(True)
+        self.assertEqual([feature["name"] for feature in features], ["user_authentication"])
+        self.assertEqual(features[0]["status"], "active")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+import sys
+import os
+import random
+from unittest import mock
+
+# Add the repository root to the Python path to import the CLI module
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import gridwrinkl_cli
+from gridwrinkl_cli import GridWrinkl, _SkylineState
+
+GRID_SIZE = {"width": 12, "height": 8}
+ZONES = {
+    "active": {"x": 0, "y": 0, "width": 6, "height": 4},
+    "resources": {"x": 6, "y": 0, "width": 6, "height": 4},
+    "archive": {"x": 0, "y": 4, "width": 12, "height": 4}
+}
+
+
+def _block(name, category, width=1, height=1):
+    """테스트용 블록 생성"""
+    return {"name": name, "category": category, "width": width, "height": height}
+
+
+class TestGridLayout(unittest.TestCase):
+    """
+    그리드 블록 배치(MaxRects, Skyline)에 대한 테스트 케이스
+    """
+
+    def setUp(self):
+        """
+        각 테스트 전에 실행되는 설정 메서드
+        - GridWrinkl 인스턴스를 생성합니다.
+        """
+        self.gridwrinkl = GridWrinkl(".")
+
+    def _occupied_cells(self, blocks):
+        """배치된 블록이 차지하는 셀 목록 (중복 포함)"""
+        cells = []
+        for block in blocks:
+            if block["placed"]:
+                x, y = block["position"]["x"], block["position"]["y"]
+                cells.extend(
+                    (cx, cy)
+                    for cx in range(x, x + block["width"])
+                    for cy in range(y, y + block["height"])
+                )
+        return cells
+
+    def test_blocks_do_not_overlap_and_stay_in_zone(self):
+        """
+        배치된 블록이 서로 겹치지 않고 자기 영역 안에 있는지 테스트
+        """
+        categories = ["active", "pending", "archive", "resources", "reference"]
+        sizes = [(1, 1), (2, 1), (1, 3), (2, 2), (3, 2)]
+        blocks = [
+            _block(f"b{i}", categories[i % len(categories)], *sizes[i % len(sizes)])
+            for i in range(25)
+        ]
+
+        new_blocks, _ = self.gridwrinkl._reorganize_blocks(blocks, ZONES, GRID_SIZE)
+
+        cells = self._occupied_cells(new_blocks)
+        self.assertEqual(len(cells), len(set(cells)))
+        for block in new_blocks:
+            if not block["placed"]:
+                continue
+            zone = ZONES[self.gridwrinkl.category_to_zone.get(block["category"], "archive")]
+            x, y = block["position"]["x"], block["position"]["y"]
+            self.assertGreaterEqual(x, zone["x"])
+            self.assertGreaterEqual(y, zone["y"])
+            self.assertLessEqual(x + block["width"], zone["x"] + zone["width"])
+            self.assertLessEqual(y + block["height"], zone["y"] + zone["height"])
+
+    def test_overlapping_zones_do_not_double_book_cells(self):
+        """
+        겹치는 영역에서 같은 셀에 두 블록이 배치되지 않는지 테스트
+        """
+        zones = {
+            "active": {"x": 0, "y": 0, "width": 3, "height": 3},
+            "resources": {"x": 1, "y": 1, "width": 3, "height": 3},
+            "archive": {"x": 2, "y": 0, "width": 2, "height": 4}
+        }
+        blocks = [_block(f"a{i}", "active") for i in range(9)]
+        blocks += [_block(f"r{i}", "resources") for i in range(9)]
+        blocks += [_block(f"c{i}", "archive") for i in range(8)]
+
+        new_blocks, placed_count = self.gridwrinkl._reorganize_blocks(
+            blocks, zones, {"width": 4, "height": 4}
+        )
+
+        cells = self._occupied_cells(new_blocks)
+        self.assertEqual(len(cells), len(set(cells)))
+        # 세 영역의 합집합은 4x4 중 (0, 3) 한 칸을 제외한 15칸
+        self.assertEqual(placed_count, 15)
+
+    def test_placed_count_and_unplaced_blocks(self):
+        """
+        배치 수가 placed 플래그와 일치하고 미배치 블록에 position이 없는지 테스트
+        """
+        zones = {"active": {"x": 0, "y": 0, "width": 2, "height": 2}}
+        blocks = [_block(f"b{i}", "active") for i in range(6)]
+        # 이전 레이아웃의 위치 정보는 재배치 시 지워져야 함
+        blocks[-1]["placed"] = True
+        blocks[-1]["position"] = {"x": 0, "y": 0}
+
+        new_blocks, placed_count = self.gridwrinkl._reorganize_blocks(blocks, zones, GRID_SIZE)
+
+        self.assertEqual(len(new_blocks), len(blocks))
+        self.assertEqual(placed_count, 4)
+        self.assertEqual(placed_count, sum(block["placed"] for block in new_blocks))
+        for block in new_blocks:
+            if not block["placed"]:
+                self.assertNotIn("position", block)
+        # 입력 블록은 변경되지 않음
+        self.assertEqual(blocks[-1]["position"], {"x": 0, "y": 0})
+
+    def test_skyline_insert_respects_existing_rects(self):
+        """
+        스카이라인 삽입이 기존 블록 위치를 피해서 배치되는지 테스트
+        """
+        zone = {"x": 2, "y": 1, "width": 3, "height": 2}
+        skyline = _SkylineState.from_rects(zone, GRID_SIZE, [(2, 1, 2, 1), (4, 1, 1, 2)])
+
+        self.assertEqual(skyline.insert(1, 1), (2, 2))
+        self.assertEqual(skyline.insert(1, 1), (3, 2))
+
+    def test_skyline_insert_returns_none_when_full(self):
+        """
+        영역이 가득 찼을 때 스카이라인 삽입이 None을 반환하는지 테스트
+        """
+        zone = {"x": 0, "y": 0, "width": 2, "height": 2}
+        skyline = _SkylineState.from_rects(zone, GRID_SIZE, [(0, 0, 2, 1)])
+
+        self.assertIsNone(skyline.insert(1, 2))
+        self.assertEqual(skyline.insert(2, 1), (0, 1))
+        self.assertIsNone(skyline.insert(1, 1))
+
+    @unittest.skipUnless(gridwrinkl_cli._numba_available(), "numba가 설치되어 있지 않음")
+    def test_jit_placement_matches_python_placement(self):
+        """
+        JIT 커널 배치 결과가 파이썬 구현과 같은지 테스트
+        """
+        rng = random.Random(0)
+        categories = ["active", "pending", "archive", "resources", "reference"]
+        blocks = [
+            _block(f"b{i}", rng.choice(categories), rng.randint(1, 3), rng.randint(1, 3))
+            for i in range(40)
+        ]
+
+        expected = self.gridwrinkl._reorganize_blocks(blocks, ZONES, GRID_SIZE)
+        with mock.patch.object(gridwrinkl_cli, "_JIT_PLACEMENT_THRESHOLD", 0):
+            actual = self.gridwrinkl._reorganize_blocks(blocks, ZONES, GRID_SIZE)
+
+        self.assertEqual(actual, expected)
+
+if __name__ == '__main__':
+    unittest.main()
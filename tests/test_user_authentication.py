@@ -18,9 +18,10 @@ class TestUserAuthentication(unittest.TestCase):
     def setUp(self):
         """
         각 테스트 전에 실행되는 설정 메서드
-        - 사용자 데이터베이스를 초기화합니다.
+        - 사용자 데이터베이스와 이메일 인덱스를 초기화합니다.
         """
         services._users_db.clear()
+        services._email_to_id.clear()
 
     def test_create_user_success(self):
         """